@@ -9,6 +9,7 @@ from typing import Optional
 
 import chromadb
 from chromadb.api import ClientAPI
+from chromadb.api.types import QueryResult
 from chromadb.config import Settings
 
 from memoria.domain.entities import Document, SearchResult
@@ -135,32 +136,57 @@ class ChromaDBAdapter:
         Returns:
             List of search results sorted by relevance (highest first)
         """
+        return self.search_batch([query_embedding], k)[0]
+
+    def search_batch(
+        self, query_embeddings: list[list[float]], k: int = 5
+    ) -> list[list[SearchResult]]:
+        """
+        Search for documents similar to each query vector in one query call.
+
+        ChromaDB accepts several query embeddings per request, so this costs
+        a single HTTP round trip regardless of the number of queries.
+
+        Args:
+            query_embeddings: Query vectors
+            k: Number of results to return per query
+
+        Returns:
+            One list of search results per query, each sorted by relevance
+        """
+        if not query_embeddings:
+            return []
+
         # Query ChromaDB
         results = self._collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=k,
         )
 
         # Diagnostic logging (can be disabled for production)
         import os
         if os.getenv("MEMORIA_DEBUG"):
-            num_results = len(results["ids"][0]) if results["ids"] else 0
-            print(f"[DEBUG] ChromaDB returned {num_results} results for k={k}")
-            if results.get("distances") and results["distances"][0]:
-                distances = results["distances"][0]
-                print(f"[DEBUG] Distance range: [{min(distances):.6f}, {max(distances):.6f}]")
+            for row in range(len(query_embeddings)):
+                num_results = len(results["ids"][row]) if results["ids"] else 0
+                print(f"[DEBUG] ChromaDB returned {num_results} results for k={k}")
+                if results.get("distances") and results["distances"][row]:
+                    distances = results["distances"][row]
+                    print(f"[DEBUG] Distance range: [{min(distances):.6f}, {max(distances):.6f}]")
+
+        return [self._to_search_results(results, row) for row in range(len(query_embeddings))]
 
-        # Convert to SearchResult entities
+    def _to_search_results(self, results: QueryResult, row: int) -> list[SearchResult]:
+        """Convert one row of a ChromaDB query response to SearchResult entities."""
         search_results: list[SearchResult] = []
 
-        if not results["ids"] or not results["ids"][0]:
+        if not results["ids"] or not results["ids"][row]:
             return search_results
 
-        for i in range(len(results["ids"][0])):
-            doc_id = results["ids"][0][i]
-            content = results["documents"][0][i] if results["documents"] else ""
-            metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-            distance = results["distances"][0][i] if results["distances"] else 0.0
+        for i in range(len(results["ids"][row])):
+            doc_id = results["ids"][row][i]
+            content = results["documents"][row][i] if results["documents"] else ""
+            metadata = results["metadatas"][row][i] if results["metadatas"] else {}
+            distance = results["distances"][row][i] if results["distances"] else 0.0
 
             # Convert distance to similarity score (0-1 range)
             # ChromaDB uses cosine distance: smaller = more similar
@@ -169,8 +195,8 @@ class ChromaDBAdapter:
 
             # Get embedding if available
             embedding = None
-            if results.get("embeddings") and results["embeddings"][0]:
-                embedding = results["embeddings"][0][i]
+            if results.get("embeddings") and results["embeddings"][row]:
+                embedding = results["embeddings"][row][i]
 
             # Create document
             document = Document(
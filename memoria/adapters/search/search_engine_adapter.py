@@ -7,6 +7,7 @@ Includes query expansion and result reranking.
 
 import os
 import time
+from functools import lru_cache
 
 from memoria.domain.entities import Document, SearchResult
 from memoria.domain.ports.search_engine import SearchEnginePort
@@ -49,6 +50,12 @@ class SearchEngineAdapter:
             "api": ["api", "interface", "endpoint"],
         }
 
+        # Repeated queries reuse their embedding instead of re-running the model
+        self._embed_query = lru_cache(maxsize=256)(self._embedder.embed_text)
+
+        # QueryTerms is immutable, so repeated queries can share one expansion
+        self._cached_expand_query = lru_cache(maxsize=1024)(self._expand_query)
+
     def search(
         self,
         query: str,
@@ -66,35 +73,97 @@ class SearchEngineAdapter:
         Returns:
             List of search results sorted by relevance
         """
-        if mode == "semantic":
-            return self._semantic_search(query, limit)
-        elif mode == "bm25":
-            return self._bm25_search(query, limit)
-        else:  # hybrid
-            return self._hybrid_search(query, limit)
-
-    def _semantic_search(self, query: str, limit: int) -> list[SearchResult]:
-        """Perform semantic vector similarity search."""
-        # Generate query embedding
         t0 = time.time()
-        query_embedding = self._embedder.embed_text(query)
+        query_embedding = self._embed_query(query)
         embed_ms = (time.time() - t0) * 1000
 
-        # Search vector store
         t1 = time.time()
-        results = self._vector_store.search(
+        candidates = self._vector_store.search(
             query_embedding=query_embedding.vector,
-            k=limit,
+            k=self._candidate_count(mode, limit),
         )
         search_ms = (time.time() - t1) * 1000
 
         if os.getenv("MEMORIA_DEBUG"):
-            print(f"[PERF] semantic_search: embed={embed_ms:.1f}ms, "
-                  f"chromadb={search_ms:.1f}ms, results={len(results)}")
+            print(f"[PERF] search: embed={embed_ms:.1f}ms, "
+                  f"chromadb={search_ms:.1f}ms, candidates={len(candidates)}")
 
-        return results
+        return self._rank_candidates(query, candidates, mode, limit)
 
-    def _bm25_search(self, query: str, limit: int) -> list[SearchResult]:
+    def search_batch(
+        self,
+        queries: list[str],
+        mode: SearchMode,
+        limit: int,
+    ) -> list[list[SearchResult]]:
+        """
+        Search for documents matching each of several queries.
+
+        Query embeddings are generated with a single embed_batch() call and
+        candidates for every query are fetched with a single vector store
+        search_batch() call, so the whole batch costs one forward pass and
+        one round trip.
+
+        Args:
+            queries: Search query texts
+            mode: Search mode (semantic, bm25, or hybrid)
+            limit: Maximum number of results per query
+
+        Returns:
+            One list of search results per query, in the same order as queries
+        """
+        if not queries:
+            return []
+
+        query_embeddings = self._embedder.embed_batch(queries)
+        all_candidates = self._vector_store.search_batch(
+            [query_embedding.vector for query_embedding in query_embeddings],
+            k=self._candidate_count(mode, limit),
+        )
+        return [
+            self._rank_candidates(query, candidates, mode, limit)
+            for query, candidates in zip(queries, all_candidates)
+        ]
+
+    @staticmethod
+    def _candidate_count(mode: SearchMode, limit: int) -> int:
+        """Return how many vector store candidates a search in mode needs."""
+        if mode == "semantic":
+            return limit
+        elif mode == "bm25":
+            return limit * 2  # Get more candidates for reranking
+        else:  # hybrid: the keyword pass reranks limit * 2 * 2 candidates
+            return limit * 4
+
+    def _rank_candidates(
+        self,
+        query: str,
+        candidates: list[SearchResult],
+        mode: SearchMode,
+        limit: int,
+    ) -> list[SearchResult]:
+        """Dispatch scoring of vector store candidates, ordered by similarity."""
+        if mode == "semantic":
+            return self._semantic_search(candidates, limit)
+        elif mode == "bm25":
+            return self._bm25_search(query, candidates, limit)
+        else:  # hybrid
+            return self._hybrid_search(query, candidates, limit)
+
+    def _semantic_search(
+        self,
+        candidates: list[SearchResult],
+        limit: int,
+    ) -> list[SearchResult]:
+        """Return the top candidates by vector similarity."""
+        return candidates[:limit]
+
+    def _bm25_search(
+        self,
+        query: str,
+        candidates: list[SearchResult],
+        limit: int,
+    ) -> list[SearchResult]:
         """
         Perform BM25 keyword search.
 
@@ -102,24 +171,11 @@ class SearchEngineAdapter:
         """
         query_terms = query.lower().split()
 
-        # Get all documents from vector store
+        # Rerank the top semantic candidates by keyword relevance
         # Note: In production, this would use a dedicated text index
-        stats = self._vector_store.get_stats()
-        if stats.get("document_count", 0) == 0:
-            return []
-
-        # For now, we'll use semantic search to get candidates,
-        # then rerank by keyword relevance
         # (This is a simplified implementation)
-        query_embedding = self._embedder.embed_text(query)
-        candidates = self._vector_store.search(
-            query_embedding=query_embedding.vector,
-            k=limit * 2,  # Get more candidates for reranking
-        )
-
-        # Score by keyword presence
         scored_results: list[tuple[SearchResult, float]] = []
-        for result in candidates:
+        for result in candidates[:limit * 2]:
             content_lower = result.document.content.lower()
             keyword_score = sum(
                 content_lower.count(term) for term in query_terms
@@ -140,7 +196,12 @@ class SearchEngineAdapter:
             for i, (result, keyword_score) in enumerate(scored_results[:limit])
         ]
 
-    def _hybrid_search(self, query: str, limit: int) -> list[SearchResult]:
+    def _hybrid_search(
+        self,
+        query: str,
+        candidates: list[SearchResult],
+        limit: int,
+    ) -> list[SearchResult]:
         """
         Perform hybrid search combining semantic and keyword search.
 
@@ -148,11 +209,9 @@ class SearchEngineAdapter:
         """
         t0 = time.time()
 
-        # Get semantic results
-        semantic_results = self._semantic_search(query, limit * 2)
-
-        # Get keyword results
-        keyword_results = self._bm25_search(query, limit * 2)
+        # Both passes score the same candidates, fetched once
+        semantic_results = self._semantic_search(candidates, limit * 2)
+        keyword_results = self._bm25_search(query, candidates, limit * 2)
 
         # Combine scores
         doc_scores: dict[str, tuple[Document, float, float]] = {}
@@ -212,6 +271,10 @@ class SearchEngineAdapter:
         Returns:
             QueryTerms with original and expanded terms
         """
+        return self._cached_expand_query(query)
+
+    def _expand_query(self, query: str) -> QueryTerms:
+        """Expand query against the synonym dictionary (uncached)."""
         query_lower = query.lower()
         expanded = [query]  # Always include original
 
@@ -230,7 +293,7 @@ class SearchEngineAdapter:
 
         return QueryTerms(
             original=query,
-            expanded=unique_expanded,
+            expanded=tuple(unique_expanded),
         )
 
     def rerank(
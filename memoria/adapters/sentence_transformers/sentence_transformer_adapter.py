@@ -5,6 +5,7 @@ Uses sentence-transformers library to generate text embeddings.
 Must pass all EmbeddingGeneratorPortTests to ensure compatibility.
 """
 
+from functools import lru_cache
 from typing import Optional
 
 from sentence_transformers import SentenceTransformer
@@ -13,12 +14,26 @@ from memoria.domain.ports.embedding_generator import EmbeddingGeneratorPort
 from memoria.domain.value_objects import Embedding
 
 
+@lru_cache(maxsize=None)
+def _load_model(model_name: str, device: Optional[str]) -> SentenceTransformer:
+    """
+    Load a SentenceTransformer model once per (model_name, device).
+
+    Adapters created with the same settings share the loaded weights
+    instead of each reading them from disk.
+    """
+    return SentenceTransformer(model_name, device=device)
+
+
 class SentenceTransformerAdapter:
     """
     Adapter for SentenceTransformer embedding generation.
 
     Implements EmbeddingGeneratorPort protocol using sentence-transformers library.
     Supports batch processing and lazy model loading.
+
+    Embeddings are L2-normalized at encode time, so cosine similarity between
+    them is a plain dot product.
     """
 
     def __init__(
@@ -50,10 +65,7 @@ class SentenceTransformerAdapter:
             Loaded SentenceTransformer instance
         """
         if self._model is None:
-            self._model = SentenceTransformer(
-                self._model_name,
-                device=self._device,
-            )
+            self._model = _load_model(self._model_name, self._device)
         return self._model
 
     @property
@@ -94,6 +106,7 @@ class SentenceTransformerAdapter:
         vector = self.model.encode(
             text,
             convert_to_numpy=True,
+            normalize_embeddings=True,
             show_progress_bar=False,  # No progress for single text
         )
 
@@ -119,6 +132,7 @@ class SentenceTransformerAdapter:
         vectors = self.model.encode(
             texts,
             convert_to_numpy=True,
+            normalize_embeddings=True,
             show_progress_bar=self._show_progress,
             batch_size=32,  # Efficient batch size
         )
@@ -64,6 +64,22 @@ class SearchEngineStub:
 
         return search_results
 
+    def search_batch(
+        self, queries: list[str], mode: SearchMode, limit: int
+    ) -> list[list[SearchResult]]:
+        """
+        Search documents for each query using simple keyword matching.
+
+        Args:
+            queries: Search queries
+            mode: Search mode (semantic, bm25, hybrid) - all behave similarly in stub
+            limit: Maximum results to return per query
+
+        Returns:
+            One list of search results per query, in the same order as queries
+        """
+        return [self.search(query, mode, limit) for query in queries]
+
     def expand_query(self, query: str) -> QueryTerms:
         """
         Expand query with mock synonyms/related terms.
@@ -93,7 +109,7 @@ class SearchEngineStub:
             # Multiple words: add individual words
             expanded.extend(words)
 
-        return QueryTerms(original=query, expanded=expanded)
+        return QueryTerms(original=query, expanded=tuple(expanded))
 
     def rerank(self, query: str, results: list[SearchResult]) -> list[SearchResult]:
         """
@@ -65,6 +65,12 @@ class VectorStoreStub:
 
         return search_results
 
+    def search_batch(
+        self, query_embeddings: list[list[float]], k: int
+    ) -> list[list[SearchResult]]:
+        """Search for each query embedding in turn."""
+        return [self.search(query_embedding, k) for query_embedding in query_embeddings]
+
     def get_by_id(self, doc_id: str) -> Optional[Document]:
         """Retrieve document by ID."""
         return self._documents.get(doc_id)
@@ -5,7 +5,7 @@ All entities are immutable (frozen dataclasses) to prevent accidental mutation
 and ensure thread safety.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
@@ -48,7 +48,7 @@ class SearchResult:
 
     def __post_init__(self) -> None:
         """Validate search result invariants."""
-        if self.score < 0.0 or self.score > 1.0:
+        if not 0.0 <= self.score <= 1.0:
             raise ValueError(f"Score must be in [0.0, 1.0], got {self.score}")
         if self.rank < 0:
             raise ValueError(f"Rank must be non-negative, got {self.rank}")
@@ -67,6 +67,7 @@ class Chunk:
     start_pos: int
     end_pos: int
     metadata: dict[str, str]
+    length: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate chunk invariants."""
@@ -78,15 +79,12 @@ class Chunk:
             raise ValueError(
                 f"End position ({self.end_pos}) must be greater than start ({self.start_pos})"
             )
-
-    @property
-    def length(self) -> int:
-        """Return the length of the chunk in characters."""
-        return self.end_pos - self.start_pos
+        # Length of the chunk in characters, fixed at construction
+        object.__setattr__(self, "length", self.end_pos - self.start_pos)
 
     def overlaps(self, other: "Chunk") -> bool:
         """Check if this chunk overlaps with another chunk."""
-        return not (self.end_pos <= other.start_pos or self.start_pos >= other.end_pos)
+        return self.start_pos < other.end_pos and other.start_pos < self.end_pos
 
 
 class ProgressTracker:
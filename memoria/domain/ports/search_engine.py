@@ -38,6 +38,29 @@ class SearchEnginePort(Protocol):
         """
         ...
 
+    def search_batch(
+        self, queries: list[str], mode: SearchMode, limit: int
+    ) -> list[list[SearchResult]]:
+        """
+        Search for documents matching each of several queries.
+
+        Adapters backed by an embedding model should embed all queries
+        in one batched call rather than one call per query.
+
+        Args:
+            queries: User search queries
+            mode: Search mode (semantic, bm25, or hybrid)
+            limit: Maximum number of results to return per query
+
+        Returns:
+            One list of search results per query, in the same order as queries
+
+        Raises:
+            ValueError: If any query is empty or limit is invalid
+            RuntimeError: If search fails
+        """
+        ...
+
     def expand_query(self, query: str) -> QueryTerms:
         """
         Expand query with synonyms, related terms, etc.
@@ -49,6 +49,29 @@ class VectorStorePort(Protocol):
         """
         ...
 
+    def search_batch(
+        self, query_embeddings: list[list[float]], k: int
+    ) -> list[list[SearchResult]]:
+        """
+        Search for documents similar to each of several query embeddings.
+
+        Adapters backed by a remote or indexed store should answer all
+        queries in one round trip rather than one call per query.
+
+        Args:
+            query_embeddings: Query vectors to search for
+            k: Number of results to return per query
+
+        Returns:
+            One list of search results per query, in the same order as
+            query_embeddings, each ordered by relevance (highest first)
+
+        Raises:
+            ValueError: If k is invalid or an embedding is wrong dimension
+            ConnectionError: If unable to connect to vector store
+        """
+        ...
+
     def get_by_id(self, doc_id: str) -> Document | None:
         """
         Retrieve a document by its ID.
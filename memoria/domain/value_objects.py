@@ -6,13 +6,14 @@ They are frozen dataclasses to ensure immutability.
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Literal
 
 
 SearchMode = Literal["semantic", "bm25", "hybrid"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Score:
     """
     A relevance score for a search result.
@@ -24,7 +25,7 @@ class Score:
 
     def __post_init__(self) -> None:
         """Validate score is in valid range."""
-        if self.value < 0.0 or self.value > 1.0:
+        if not 0.0 <= self.value <= 1.0:
             raise ValueError(f"Score must be in [0.0, 1.0], got {self.value}")
 
     def __float__(self) -> float:
@@ -80,6 +81,31 @@ class Embedding:
         """Convert embedding to a list (for serialization)."""
         return list(self.vector)  # Return a copy to maintain immutability
 
+    def normalized(self) -> "Embedding":
+        """
+        Return a copy of this embedding scaled to unit (L2) length.
+
+        For unit-length vectors cosine similarity reduces to a plain dot
+        product, so normalizing once up front avoids recomputing norms
+        for every comparison.
+        """
+        norm = sum(x * x for x in self.vector) ** 0.5
+        if norm == 0.0:
+            raise ValueError("Cannot normalize a zero-length embedding")
+        return Embedding(vector=[x / norm for x in self.vector])
+
+    def dot(self, other: "Embedding") -> float:
+        """
+        Return the dot product with another embedding.
+
+        Equals cosine similarity when both embeddings are normalized.
+        """
+        if self.dimensions != other.dimensions:
+            raise ValueError(
+                f"Embedding dimensions must match: {self.dimensions} != {other.dimensions}"
+            )
+        return float(sum(a * b for a, b in zip(self.vector, other.vector)))
+
 
 @dataclass(frozen=True)
 class QueryTerms:
@@ -88,22 +114,25 @@ class QueryTerms:
 
     Represents the final query terms used for searching, potentially
     after expansion, synonym replacement, or other query preprocessing.
+
+    Expanded terms are stored as a tuple; a list is accepted and converted.
     """
 
     original: str
-    expanded: list[str]
+    expanded: tuple[str, ...]
 
     def __post_init__(self) -> None:
         """Validate query terms."""
         if not self.original:
             raise ValueError("Original query cannot be empty")
+        object.__setattr__(self, "expanded", tuple(self.expanded))
         if not self.expanded:
             raise ValueError("Expanded terms cannot be empty")
 
-    @property
-    def all_terms(self) -> list[str]:
-        """Return all terms (original + expanded)."""
-        return [self.original] + self.expanded
+    @cached_property
+    def all_terms(self) -> tuple[str, ...]:
+        """Return all terms (original + expanded), computed once."""
+        return (self.original, *self.expanded)
 
     @property
     def term_count(self) -> int:
@@ -139,13 +168,17 @@ class DocumentMetadata:
         """Check if document has a specific tag."""
         return tag in self.tags
 
+    @cached_property
+    def _tags_csv(self) -> str:
+        """Return tags as a sorted, comma-separated string, computed once."""
+        return ",".join(sorted(self.tags))
+
     def to_dict(self) -> dict[str, str]:
         """Convert metadata to dictionary for serialization."""
-        result: dict[str, str] = {
+        return {
             "source_file": self.source_file,
             "file_type": self.file_type,
             "size_bytes": str(self.size_bytes),
-            "tags": ",".join(sorted(self.tags)),
+            "tags": self._tags_csv,
+            **self.custom,
         }
-        result.update(self.custom)
-        return result
@@ -56,11 +56,8 @@ MEMORIA_ROOT = Path(__file__).parent.parent
 DOCS_DIR = MEMORIA_ROOT / "docs"
 CHROMA_DIR = MEMORIA_ROOT / "chroma_data"
 
-# Global adapter instances
-_vector_store = None
-_embedder = None
-_search_engine = None
-_document_processor = None
+# Global adapter instances: (vector_store, embedder, search_engine, document_processor)
+_adapters = None
 
 # Version check state (module-level, reset per Python process / session)
 _version_checked = False
@@ -73,9 +70,10 @@ _GH_TIMEOUT_SECONDS = 5
 
 
 def _get_adapters():
-    global _vector_store, _embedder, _search_engine, _document_processor
+    """Return the shared adapters, creating them on first use."""
+    global _adapters
 
-    if _vector_store is None:
+    if _adapters is None:
         from memoria.adapters.chromadb.chromadb_adapter import ChromaDBAdapter
         from memoria.adapters.sentence_transformers.sentence_transformer_adapter import SentenceTransformerAdapter
         from memoria.adapters.search.search_engine_adapter import SearchEngineAdapter
@@ -85,18 +83,29 @@ def _get_adapters():
         CHROMA_DIR.mkdir(parents=True, exist_ok=True)
 
         # HTTP mode for Docker ChromaDB
-        _vector_store = ChromaDBAdapter(
+        vector_store = ChromaDBAdapter(
             collection_name="memoria",
             use_http=True,
             http_host="localhost",
             http_port=8001,
         )
 
-        _embedder = SentenceTransformerAdapter(model_name="all-MiniLM-L6-v2")
-        _search_engine = SearchEngineAdapter(_vector_store, _embedder, hybrid_weight=0.95)
-        _document_processor = DocumentProcessorAdapter(chunk_size=2000, chunk_overlap=100)
+        embedder = SentenceTransformerAdapter(model_name="all-MiniLM-L6-v2")
+        search_engine = SearchEngineAdapter(vector_store, embedder, hybrid_weight=0.95)
+        document_processor = DocumentProcessorAdapter(chunk_size=2000, chunk_overlap=100)
+        _adapters = (vector_store, embedder, search_engine, document_processor)
 
-    return _vector_store, _embedder, _search_engine, _document_processor
+    return _adapters
+
+
+def _set_adapters(adapters):
+    """Install the adapters returned by _get_adapters(); pass None to reset.
+
+    Test hook: lets tests swap in fakes without patching, and restore the
+    previous tuple afterwards.
+    """
+    global _adapters
+    _adapters = adapters
 
 
 def _check_version_cache():
@@ -4,24 +4,7 @@ Acceptance tests for search quality - verify user stories are met
 Tasks: T044, T045, T046 - Acceptance tests for US1, US2, US3
 """
 
-import pytest
 from memoria.skill_helpers import search_knowledge
-from memoria.adapters.chromadb.chromadb_adapter import ChromaDBAdapter
-from memoria.adapters.sentence_transformers.sentence_transformer_adapter import SentenceTransformerAdapter
-from memoria.adapters.search.search_engine_adapter import SearchEngineAdapter
-
-
-@pytest.fixture
-def search_engine():
-    """Initialize search engine for acceptance testing"""
-    vector_store = ChromaDBAdapter(
-        collection_name="memoria",
-        use_http=True,
-        http_host="localhost",
-        http_port=8001
-    )
-    embedder = SentenceTransformerAdapter()
-    return SearchEngineAdapter(vector_store, embedder, hybrid_weight=0.95)
 
 
 class TestUS1Acceptance:
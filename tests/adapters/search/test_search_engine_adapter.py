@@ -4,6 +4,8 @@ Tests for SearchEngineAdapter.
 Inherits from SearchEnginePortTests to ensure full port compliance.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from memoria.adapters.search.search_engine_adapter import SearchEngineAdapter
@@ -76,6 +78,17 @@ class TestSearchEngineAdapter(SearchEnginePortTests):
         engine_normal = SearchEngineAdapter(vector_store, embedder, hybrid_weight=0.7)
         assert engine_normal._hybrid_weight == 0.7
 
+    def test_repeated_query_embedding_is_cached(self) -> None:
+        """Test that searching the same query twice embeds it only once."""
+        embedder = EmbeddingGeneratorStub()
+        with patch.object(embedder, "embed_text", wraps=embedder.embed_text) as embed_text:
+            engine = SearchEngineAdapter(VectorStoreStub(), embedder)
+
+            engine.search("python", mode="hybrid")
+            engine.search("python", mode="semantic")
+
+        assert embed_text.call_count == 1
+
     def test_query_expansion_with_known_terms(self) -> None:
         """Test query expansion with known synonyms."""
         engine = self.create_engine()
@@ -93,7 +106,13 @@ class TestSearchEngineAdapter(SearchEnginePortTests):
         # Test unknown term
         expanded = engine.expand_query("unknown_term_xyz")
         assert expanded.original == "unknown_term_xyz"
-        assert expanded.expanded == ["unknown_term_xyz"]  # Only original
+        assert expanded.expanded == ("unknown_term_xyz",)  # Only original
+
+    def test_query_expansion_is_cached(self) -> None:
+        """Test that repeated expansions of the same query reuse the result."""
+        engine = self.create_engine()
+
+        assert engine.expand_query("python ml") is engine.expand_query("python ml")
 
     def test_rerank_boosts_exact_matches(self) -> None:
         """Test that reranking boosts results with exact query matches."""
@@ -109,3 +128,47 @@ class TestSearchEngineAdapter(SearchEnginePortTests):
         # Check that ranks were updated
         for i, result in enumerate(reranked):
             assert result.rank == i
+
+    def test_search_batch_matches_individual_searches(self) -> None:
+        """Test that search_batch returns the same results as per-query search."""
+        engine = self.create_engine()
+        queries = ["Python programming", "machine learning", "data science"]
+
+        for mode in ("semantic", "bm25", "hybrid"):
+            batch_results = engine.search_batch(queries, mode=mode, limit=2)
+
+            assert len(batch_results) == len(queries)
+            for query, results in zip(queries, batch_results):
+                expected = engine.search(query, mode=mode, limit=2)
+                assert [r.document.id for r in results] == [r.document.id for r in expected]
+                assert [r.score for r in results] == pytest.approx([r.score for r in expected])
+
+    def test_search_batch_empty_queries(self) -> None:
+        """Test that search_batch with no queries returns no results."""
+        engine = self.create_engine()
+
+        assert engine.search_batch([], mode="hybrid", limit=5) == []
+
+    def test_search_batch_fetches_candidates_in_one_call(self) -> None:
+        """Test that search_batch makes one vector store call for the whole batch."""
+        vector_store = VectorStoreStub()
+        embedder = EmbeddingGeneratorStub()
+        vector_store.add_documents([
+            Document(
+                id=f"doc{i}",
+                content=content,
+                metadata={"source": "test.md"},
+                embedding=embedder.embed_text(content).vector,
+            )
+            for i, content in enumerate(["Python programming", "Machine learning"])
+        ])
+        engine = SearchEngineAdapter(vector_store, embedder)
+        queries = ["Python programming", "machine learning", "data science"]
+
+        for mode in ("semantic", "bm25", "hybrid"):
+            with patch.object(
+                vector_store, "search_batch", wraps=vector_store.search_batch
+            ) as search_batch:
+                engine.search_batch(queries, mode=mode, limit=2)
+
+            assert search_batch.call_count == 1
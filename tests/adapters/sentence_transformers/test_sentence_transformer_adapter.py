@@ -47,7 +47,23 @@ class TestSentenceTransformerAdapter(EmbeddingGeneratorPortTests):
         assert adapter._model is not None
         assert dims > 0
 
+    def test_adapters_share_loaded_model(self) -> None:
+        """Test that adapters with the same settings reuse one loaded model."""
+        first = SentenceTransformerAdapter(model_name="all-MiniLM-L6-v2")
+        second = SentenceTransformerAdapter(model_name="all-MiniLM-L6-v2")
+
+        assert first.model is second.model
+
     def test_model_name_property(self) -> None:
         """Test that model_name property returns the model name."""
         adapter = SentenceTransformerAdapter(model_name="all-MiniLM-L6-v2")
         assert adapter.model_name == "all-MiniLM-L6-v2"
+
+    def test_embeddings_are_normalized(self) -> None:
+        """Test that embeddings are unit length so dot product equals cosine."""
+        adapter = self.create_generator()
+        single = adapter.embed_text("python programming")
+        batch = adapter.embed_batch(["python programming", "cooking recipes"])
+
+        for emb in [single, *batch]:
+            assert emb.dot(emb) == pytest.approx(1.0, abs=1e-5)
@@ -19,8 +19,10 @@ class TestDocumentProcessorStub(DocumentProcessorPortTests):
         """Create a DocumentProcessorStub instance for testing."""
         return DocumentProcessorStub()
 
-    def create_test_file(self, tmp_path: Path, content: str, extension: str) -> Path:
+    def create_test_file(
+        self, tmp_path: Path, content: str | bytes, extension: str
+    ) -> Path:
         """Create a test file with the given content and extension."""
         file_path = tmp_path / f"test.{extension}"
-        file_path.write_text(content, encoding="utf-8")
+        file_path.write_bytes(content.encode("utf-8") if isinstance(content, str) else content)
         return file_path
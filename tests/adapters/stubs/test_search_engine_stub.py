@@ -11,7 +11,7 @@ class TestSearchEngineStub(SearchEnginePortTests):
     Test SearchEngineStub implementation.
 
     By inheriting from SearchEnginePortTests, this stub automatically
-    runs all 11 port tests to ensure it behaves correctly.
+    runs all port tests to ensure it behaves correctly.
     """
 
     def create_engine(self) -> SearchEnginePort:
@@ -10,7 +10,7 @@ class TestVectorStoreStub(VectorStorePortTests):
     Test VectorStoreStub implementation.
 
     By inheriting from VectorStorePortTests, this stub automatically
-    runs all 14 port tests to ensure it behaves correctly.
+    runs all port tests to ensure it behaves correctly.
     """
 
     def create_store(self) -> VectorStorePort:
@@ -1,7 +1,8 @@
 """
 Root pytest configuration.
 
-Redirects imports from legacy raggy.py to new facade for testing.
+Redirects imports from legacy raggy.py to new facade for testing, and
+provides session-scoped fixtures for tests that run against real services.
 """
 
 import sys
@@ -52,3 +53,47 @@ def redirect_raggy_imports():
     # Cleanup (though not strictly necessary for tests)
     if "raggy" in sys.modules:
         del sys.modules["raggy"]
+
+
+@pytest.fixture(scope="session")
+def embedder():
+    """
+    SentenceTransformer embedder shared by the whole session.
+
+    The model is loaded once, on first use, for every test module that
+    requests it.
+    """
+    from memoria.adapters.sentence_transformers.sentence_transformer_adapter import (
+        SentenceTransformerAdapter,
+    )
+
+    return SentenceTransformerAdapter(model_name="all-MiniLM-L6-v2")
+
+
+@pytest.fixture(scope="session")
+def doc_processor():
+    """Document processor with the production chunking configuration."""
+    from memoria.adapters.document.document_processor_adapter import DocumentProcessorAdapter
+
+    return DocumentProcessorAdapter(chunk_size=2000, chunk_overlap=100)
+
+
+@pytest.fixture(scope="session")
+def search_engine(embedder):
+    """
+    Search engine with production configuration, shared by the whole session.
+
+    Connects to the ChromaDB container on localhost:8001. Built once so the
+    HTTP client is set up a single time for all integration and acceptance
+    tests.
+    """
+    from memoria.adapters.chromadb.chromadb_adapter import ChromaDBAdapter
+    from memoria.adapters.search.search_engine_adapter import SearchEngineAdapter
+
+    vector_store = ChromaDBAdapter(
+        collection_name="memoria",
+        use_http=True,
+        http_host="localhost",
+        http_port=8001,
+    )
+    return SearchEngineAdapter(vector_store, embedder, hybrid_weight=0.95)
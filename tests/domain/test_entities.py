@@ -24,64 +24,62 @@ class TestDocument:
         doc = Document(id="doc1", content="test", metadata={}, embedding=embedding)
         assert doc.embedding == embedding
 
-    def test_document_empty_id_raises_error(self) -> None:
-        """Test that empty id raises ValueError."""
-        with pytest.raises(ValueError, match="Document id cannot be empty"):
-            Document(id="", content="test", metadata={})
-
-    def test_document_empty_content_raises_error(self) -> None:
-        """Test that empty content raises ValueError."""
-        with pytest.raises(ValueError, match="Document content cannot be empty"):
-            Document(id="doc1", content="", metadata={})
-
-    def test_document_empty_embedding_raises_error(self) -> None:
-        """Test that empty embedding list raises ValueError."""
-        with pytest.raises(ValueError, match="Embedding must be None or non-empty list"):
-            Document(id="doc1", content="test", metadata={}, embedding=[])
-
-    def test_document_is_immutable(self) -> None:
-        """Test that documents are frozen/immutable."""
-        doc = Document(id="doc1", content="test", metadata={})
-        with pytest.raises(AttributeError):
-            doc.id = "doc2"  # type: ignore[misc]
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"id": "", "content": "test"}, "Document id cannot be empty"),
+            ({"id": "doc1", "content": ""}, "Document content cannot be empty"),
+            (
+                {"id": "doc1", "content": "test", "embedding": []},
+                "Embedding must be None or non-empty list",
+            ),
+        ],
+        ids=["empty_id", "empty_content", "empty_embedding"],
+    )
+    def test_document_invalid_fields_raise_error(
+        self, kwargs: dict[str, object], message: str
+    ) -> None:
+        """Test that invalid document fields raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            Document(metadata={}, **kwargs)  # type: ignore[arg-type]
+
+
+@pytest.fixture(scope="class")
+def doc() -> Document:
+    """Shared document for search result tests."""
+    return Document(id="doc1", content="test", metadata={})
 
 
 class TestSearchResult:
     """Tests for SearchResult entity."""
 
-    def test_create_valid_search_result(self) -> None:
+    def test_create_valid_search_result(self, doc: Document) -> None:
         """Test creating a valid search result."""
-        doc = Document(id="doc1", content="test", metadata={})
         result = SearchResult(document=doc, score=0.95, rank=0)
         assert result.document == doc
         assert result.score == 0.95
         assert result.rank == 0
 
-    def test_search_result_score_out_of_range_low(self) -> None:
+    def test_search_result_score_out_of_range_low(self, doc: Document) -> None:
         """Test that score below 0.0 raises ValueError."""
-        doc = Document(id="doc1", content="test", metadata={})
         with pytest.raises(ValueError, match="Score must be in"):
             SearchResult(document=doc, score=-0.1, rank=0)
 
-    def test_search_result_score_out_of_range_high(self) -> None:
+    def test_search_result_score_out_of_range_high(self, doc: Document) -> None:
         """Test that score above 1.0 raises ValueError."""
-        doc = Document(id="doc1", content="test", metadata={})
         with pytest.raises(ValueError, match="Score must be in"):
             SearchResult(document=doc, score=1.5, rank=0)
 
-    def test_search_result_negative_rank_raises_error(self) -> None:
+    def test_search_result_nan_score_raises_error(self, doc: Document) -> None:
+        """Test that a NaN score raises ValueError."""
+        with pytest.raises(ValueError, match="Score must be in"):
+            SearchResult(document=doc, score=float("nan"), rank=0)
+
+    def test_search_result_negative_rank_raises_error(self, doc: Document) -> None:
         """Test that negative rank raises ValueError."""
-        doc = Document(id="doc1", content="test", metadata={})
         with pytest.raises(ValueError, match="Rank must be non-negative"):
             SearchResult(document=doc, score=0.5, rank=-1)
 
-    def test_search_result_is_immutable(self) -> None:
-        """Test that search results are frozen/immutable."""
-        doc = Document(id="doc1", content="test", metadata={})
-        result = SearchResult(document=doc, score=0.5, rank=0)
-        with pytest.raises(AttributeError):
-            result.score = 0.9  # type: ignore[misc]
-
 
 class TestChunk:
     """Tests for Chunk entity."""
@@ -94,20 +92,21 @@ class TestChunk:
         assert chunk.end_pos == 10
         assert chunk.length == 10
 
-    def test_chunk_empty_text_raises_error(self) -> None:
-        """Test that empty text raises ValueError."""
-        with pytest.raises(ValueError, match="Chunk text cannot be empty"):
-            Chunk(text="", start_pos=0, end_pos=10, metadata={})
-
-    def test_chunk_negative_start_pos_raises_error(self) -> None:
-        """Test that negative start position raises ValueError."""
-        with pytest.raises(ValueError, match="Start position must be non-negative"):
-            Chunk(text="test", start_pos=-1, end_pos=10, metadata={})
-
-    def test_chunk_end_before_start_raises_error(self) -> None:
-        """Test that end position before start raises ValueError."""
-        with pytest.raises(ValueError, match="End position .* must be greater than start"):
-            Chunk(text="test", start_pos=10, end_pos=5, metadata={})
+    @pytest.mark.parametrize(
+        ("text", "start_pos", "end_pos", "message"),
+        [
+            ("", 0, 10, "Chunk text cannot be empty"),
+            ("test", -1, 10, "Start position must be non-negative"),
+            ("test", 10, 5, "End position .* must be greater than start"),
+        ],
+        ids=["empty_text", "negative_start_pos", "end_before_start"],
+    )
+    def test_chunk_invalid_fields_raise_error(
+        self, text: str, start_pos: int, end_pos: int, message: str
+    ) -> None:
+        """Test that invalid chunk fields raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            Chunk(text=text, start_pos=start_pos, end_pos=end_pos, metadata={})
 
     def test_chunk_length_property(self) -> None:
         """Test chunk length calculation."""
@@ -125,11 +124,13 @@ class TestChunk:
         assert not chunk1.overlaps(chunk3)
         assert not chunk3.overlaps(chunk1)
 
-    def test_chunk_is_immutable(self) -> None:
-        """Test that chunks are frozen/immutable."""
-        chunk = Chunk(text="test", start_pos=0, end_pos=10, metadata={})
-        with pytest.raises(AttributeError):
-            chunk.text = "modified"  # type: ignore[misc]
+    def test_adjacent_chunks_do_not_overlap(self) -> None:
+        """Test that chunks sharing only a boundary do not overlap."""
+        chunk1 = Chunk(text="test1", start_pos=0, end_pos=10, metadata={})
+        chunk2 = Chunk(text="test2", start_pos=10, end_pos=20, metadata={})
+
+        assert not chunk1.overlaps(chunk2)
+        assert not chunk2.overlaps(chunk1)
 
 
 class TestProgressTracker:
@@ -201,3 +202,30 @@ class TestProgressTracker:
         assert tracker.end_time is None
         tracker.finish()
         assert tracker.end_time is not None
+
+
+class TestImmutability:
+    """Tests that domain entities are frozen."""
+
+    @pytest.mark.parametrize(
+        ("obj", "attr", "value"),
+        [
+            (Document(id="doc1", content="test", metadata={}), "id", "doc2"),
+            (
+                SearchResult(
+                    document=Document(id="doc1", content="test", metadata={}),
+                    score=0.5,
+                    rank=0,
+                ),
+                "score",
+                0.9,
+            ),
+            (Chunk(text="test", start_pos=0, end_pos=10, metadata={}), "text", "modified"),
+            (Chunk(text="test", start_pos=0, end_pos=10, metadata={}), "length", 99),
+        ],
+        ids=["document", "search_result", "chunk", "chunk_length"],
+    )
+    def test_entity_is_immutable(self, obj: object, attr: str, value: object) -> None:
+        """Test that assigning to a field raises AttributeError."""
+        with pytest.raises(AttributeError):
+            setattr(obj, attr, value)
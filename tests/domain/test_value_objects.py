@@ -1,5 +1,7 @@
 """Unit tests for domain value objects."""
 
+import math
+
 import pytest
 
 from memoria.domain.value_objects import DocumentMetadata, Embedding, QueryTerms, Score
@@ -14,15 +16,13 @@ class TestScore:
         assert score.value == 0.75
         assert float(score) == 0.75
 
-    def test_score_below_zero_raises_error(self) -> None:
-        """Test that score below 0.0 raises ValueError."""
-        with pytest.raises(ValueError, match="Score must be in"):
-            Score(value=-0.1)
-
-    def test_score_above_one_raises_error(self) -> None:
-        """Test that score above 1.0 raises ValueError."""
+    @pytest.mark.parametrize(
+        "value", [-0.1, 1.5, math.nan], ids=["below_zero", "above_one", "nan"]
+    )
+    def test_score_out_of_range_raises_error(self, value: float) -> None:
+        """Test that scores outside [0.0, 1.0] raise ValueError."""
         with pytest.raises(ValueError, match="Score must be in"):
-            Score(value=1.5)
+            Score(value=value)
 
     def test_score_boundary_values(self) -> None:
         """Test boundary values 0.0 and 1.0."""
@@ -41,11 +41,10 @@ class TestScore:
         assert low <= Score(value=0.3)
         assert high >= Score(value=0.8)
 
-    def test_score_is_immutable(self) -> None:
-        """Test that scores are frozen/immutable."""
+    def test_score_uses_slots(self) -> None:
+        """Test that scores carry no per-instance __dict__."""
         score = Score(value=0.5)
-        with pytest.raises(AttributeError):
-            score.value = 0.9  # type: ignore[misc]
+        assert not hasattr(score, "__dict__")
 
 
 class TestEmbedding:
@@ -79,11 +78,32 @@ class TestEmbedding:
         assert Embedding(vector=[1.0] * 384).dimensions == 384
         assert Embedding(vector=[1.0] * 768).dimensions == 768
 
-    def test_embedding_is_immutable(self) -> None:
-        """Test that embeddings are frozen/immutable."""
-        emb = Embedding(vector=[0.1, 0.2])
-        with pytest.raises(AttributeError):
-            emb.vector = [0.3, 0.4]  # type: ignore[misc]
+    def test_embedding_normalized_has_unit_length(self) -> None:
+        """Test that normalized() returns a unit-length copy."""
+        emb = Embedding(vector=[3.0, 4.0])
+        unit = emb.normalized()
+        assert math.sqrt(sum(x * x for x in unit.vector)) == pytest.approx(1.0)
+        assert unit.vector == pytest.approx([0.6, 0.8])
+        assert emb.vector == [3.0, 4.0]  # Original unchanged
+
+    def test_embedding_normalized_zero_vector_raises_error(self) -> None:
+        """Test that a zero vector cannot be normalized."""
+        with pytest.raises(ValueError, match="Cannot normalize"):
+            Embedding(vector=[0.0, 0.0]).normalized()
+
+    def test_embedding_dot_of_normalized_equals_cosine(self) -> None:
+        """Test that dot product of normalized embeddings is cosine similarity."""
+        a = Embedding(vector=[1.0, 2.0, 3.0])
+        b = Embedding(vector=[4.0, 5.0, 6.0])
+        norm_a = math.sqrt(sum(x * x for x in a.vector))
+        norm_b = math.sqrt(sum(x * x for x in b.vector))
+        cosine = sum(x * y for x, y in zip(a.vector, b.vector)) / (norm_a * norm_b)
+        assert a.normalized().dot(b.normalized()) == pytest.approx(cosine)
+
+    def test_embedding_dot_dimension_mismatch_raises_error(self) -> None:
+        """Test that dot product requires matching dimensions."""
+        with pytest.raises(ValueError, match="dimensions must match"):
+            Embedding(vector=[1.0, 2.0]).dot(Embedding(vector=[1.0, 2.0, 3.0]))
 
 
 class TestQueryTerms:
@@ -91,36 +111,41 @@ class TestQueryTerms:
 
     def test_create_valid_query_terms(self) -> None:
         """Test creating valid query terms."""
-        terms = QueryTerms(original="python", expanded=["python", "programming", "code"])
+        terms = QueryTerms(original="python", expanded=("python", "programming", "code"))
         assert terms.original == "python"
-        assert terms.expanded == ["python", "programming", "code"]
+        assert terms.expanded == ("python", "programming", "code")
+
+    def test_query_terms_list_expanded_is_stored_as_tuple(self) -> None:
+        """Test that a list of expanded terms is converted to a hashable tuple."""
+        terms = QueryTerms(original="python", expanded=["python", "code"])  # type: ignore[arg-type]
+        assert terms.expanded == ("python", "code")
+        assert hash(terms) == hash(QueryTerms(original="python", expanded=("python", "code")))
 
     def test_query_terms_empty_original_raises_error(self) -> None:
         """Test that empty original raises ValueError."""
         with pytest.raises(ValueError, match="Original query cannot be empty"):
-            QueryTerms(original="", expanded=["test"])
+            QueryTerms(original="", expanded=("test",))
 
     def test_query_terms_empty_expanded_raises_error(self) -> None:
-        """Test that empty expanded list raises ValueError."""
+        """Test that empty expanded terms raise ValueError."""
         with pytest.raises(ValueError, match="Expanded terms cannot be empty"):
-            QueryTerms(original="test", expanded=[])
+            QueryTerms(original="test", expanded=())
 
     def test_query_terms_all_terms_property(self) -> None:
         """Test all_terms property."""
-        terms = QueryTerms(original="python", expanded=["programming"])
-        assert terms.all_terms == ["python", "programming"]
+        terms = QueryTerms(original="python", expanded=("programming",))
+        assert list(terms.all_terms) == ["python", "programming"]
+
+    def test_query_terms_all_terms_is_cached(self) -> None:
+        """Test that all_terms is computed once and reused."""
+        terms = QueryTerms(original="python", expanded=("programming",))
+        assert terms.all_terms is terms.all_terms
 
     def test_query_terms_term_count_property(self) -> None:
         """Test term_count property."""
-        terms = QueryTerms(original="python", expanded=["programming", "code"])
+        terms = QueryTerms(original="python", expanded=("programming", "code"))
         assert terms.term_count == 3  # 1 original + 2 expanded
 
-    def test_query_terms_is_immutable(self) -> None:
-        """Test that query terms are frozen/immutable."""
-        terms = QueryTerms(original="test", expanded=["testing"])
-        with pytest.raises(AttributeError):
-            terms.original = "modified"  # type: ignore[misc]
-
 
 class TestDocumentMetadata:
     """Tests for DocumentMetadata value object."""
@@ -201,14 +226,45 @@ class TestDocumentMetadata:
         # Tags should be comma-separated sorted
         assert "coding" in result["tags"] and "python" in result["tags"]
 
-    def test_metadata_is_immutable(self) -> None:
-        """Test that metadata is frozen/immutable."""
+    def test_metadata_to_dict_returns_fresh_dict(self) -> None:
+        """Test that mutating one to_dict() result does not leak into the next."""
         metadata = DocumentMetadata(
             source_file="test.pdf",
             file_type="pdf",
-            size_bytes=100,
-            tags=frozenset(),
+            size_bytes=1024,
+            tags=frozenset(["python", "coding"]),
             custom={},
         )
+        first = metadata.to_dict()
+        first["tags"] = "modified"
+
+        assert metadata.to_dict()["tags"] == "coding,python"
+
+
+class TestImmutability:
+    """Tests that value objects are frozen."""
+
+    @pytest.mark.parametrize(
+        ("obj", "attr", "value"),
+        [
+            (Score(value=0.5), "value", 0.9),
+            (Embedding(vector=[0.1, 0.2]), "vector", [0.3, 0.4]),
+            (QueryTerms(original="test", expanded=("testing",)), "original", "modified"),
+            (
+                DocumentMetadata(
+                    source_file="test.pdf",
+                    file_type="pdf",
+                    size_bytes=100,
+                    tags=frozenset(),
+                    custom={},
+                ),
+                "source_file",
+                "modified.pdf",
+            ),
+        ],
+        ids=["score", "embedding", "query_terms", "document_metadata"],
+    )
+    def test_value_object_is_immutable(self, obj: object, attr: str, value: object) -> None:
+        """Test that assigning to a field raises AttributeError."""
         with pytest.raises(AttributeError):
-            metadata.source_file = "modified.pdf"  # type: ignore[misc]
+            setattr(obj, attr, value)
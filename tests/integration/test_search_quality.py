@@ -4,23 +4,17 @@ Integration tests for search quality - verify ChromaDB search fix
 Tasks: T041, T042, T043 - Integration tests for US1, US2, US3
 """
 
-import pytest
-from memoria.adapters.chromadb.chromadb_adapter import ChromaDBAdapter
-from memoria.adapters.sentence_transformers.sentence_transformer_adapter import SentenceTransformerAdapter
-from memoria.adapters.search.search_engine_adapter import SearchEngineAdapter
+from itertools import pairwise
 
 
-@pytest.fixture
-def search_engine():
-    """Initialize search engine with production configuration"""
-    vector_store = ChromaDBAdapter(
-        collection_name="memoria",
-        use_http=True,
-        http_host="localhost",
-        http_port=8001
-    )
-    embedder = SentenceTransformerAdapter()
-    return SearchEngineAdapter(vector_store, embedder, hybrid_weight=0.95)
+def _scores(results):
+    """Return the scores of a result list as a tuple, in rank order."""
+    return tuple(r.score for r in results)
+
+
+def _shared_ids(results1, results2):
+    """Return the document IDs present in both result lists."""
+    return {r.document.id for r in results1}.intersection(r.document.id for r in results2)
 
 
 class TestMultiResultSearch:
@@ -39,8 +33,9 @@ class TestMultiResultSearch:
             "memoria system",
         ]
 
-        for query in test_queries:
-            results = search_engine.search(query=query, limit=10, mode="hybrid")
+        all_results = search_engine.search_batch(test_queries, mode="hybrid", limit=10)
+
+        for query, results in zip(test_queries, all_results):
             assert len(results) >= 5, f"Query '{query}' returned only {len(results)} results (expected ≥5)"
 
     def test_minimum_results_returned(self, search_engine):
@@ -55,7 +50,7 @@ class TestMultiResultSearch:
         """Test that limit parameter controls result count"""
         query = "test query"
 
-        for limit in [1, 5, 10, 20]:
+        for limit in (1, 5, 10, 20):
             results = search_engine.search(query=query, limit=limit, mode="hybrid")
             assert len(results) <= limit, f"Returned {len(results)} results with limit={limit}"
 
@@ -74,8 +69,9 @@ class TestConfidenceScoreRanges:
             "agent catalog",
         ]
 
-        for query in high_relevance_queries:
-            results = search_engine.search(query=query, limit=10, mode="hybrid")
+        all_results = search_engine.search_batch(high_relevance_queries, mode="hybrid", limit=10)
+
+        for query, results in zip(high_relevance_queries, all_results):
             assert len(results) > 0, f"No results for query '{query}'"
 
             top_score = results[0].score
@@ -88,10 +84,10 @@ class TestConfidenceScoreRanges:
 
         assert len(results) >= 5, "Insufficient results for score distribution test"
 
-        scores = [r.score for r in results]
+        scores = _scores(results)
 
         # Scores should be in descending order
-        assert scores == sorted(scores, reverse=True), "Scores not in descending order"
+        assert all(a >= b for a, b in pairwise(scores)), "Scores not in descending order"
 
         # Should have some variation (not all exactly the same)
         score_range = max(scores) - min(scores)
@@ -102,9 +98,12 @@ class TestConfidenceScoreRanges:
         query = "test query"
         results = search_engine.search(query=query, limit=10, mode="hybrid")
 
-        for i, result in enumerate(results):
-            assert 0.0 <= result.score <= 1.0, \
-                f"Result {i} score {result.score} out of bounds [0, 1]"
+        scores = _scores(results)
+        assert scores, "No results for score bounds test"
+
+        lowest, highest = min(scores), max(scores)
+        assert 0.0 <= lowest and highest <= 1.0, \
+            f"Scores span [{lowest}, {highest}], outside bounds [0, 1]"
 
 
 class TestSemanticSearch:
@@ -121,18 +120,18 @@ class TestSemanticSearch:
             ("code search", "git history"),
         ]
 
-        for query1, query2 in synonym_pairs:
-            results1 = search_engine.search(query=query1, limit=5, mode="hybrid")
-            results2 = search_engine.search(query=query2, limit=5, mode="hybrid")
+        queries = [query for pair in synonym_pairs for query in pair]
+        all_results = search_engine.search_batch(queries, mode="hybrid", limit=5)
 
+        for (query1, query2), results1, results2 in zip(
+            synonym_pairs, all_results[0::2], all_results[1::2]
+        ):
             # Should both return results
             assert len(results1) > 0, f"No results for '{query1}'"
             assert len(results2) > 0, f"No results for '{query2}'"
 
             # Check for conceptual overlap (at least one shared doc ID OR similar high scores)
-            docs1 = {r.document.id for r in results1}
-            docs2 = {r.document.id for r in results2}
-            overlap = docs1 & docs2
+            overlap = _shared_ids(results1, results2)
 
             # Either direct overlap or both queries score highly (indicating similar semantic space)
             has_overlap = len(overlap) > 0
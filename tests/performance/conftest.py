@@ -0,0 +1,90 @@
+"""
+Shared fixtures for performance tests.
+
+Provides a synthetic ChromaDB collection populated once per session, so
+latency tests run against a known corpus size instead of depending on
+whatever the production collection happens to contain.
+
+Requires: ChromaDB running on localhost:8001.
+"""
+
+import pytest
+
+from memoria.domain.entities import Document
+
+# SC-004 targets collections with 2000+ documents
+PERF_CORPUS_SIZE = 2000
+
+_TOPICS = [
+    "python programming", "machine learning", "docker containers", "API design",
+    "database indexing", "git workflows", "cloud infrastructure", "microservice testing",
+    "security scanning", "performance monitoring", "CI/CD pipelines", "kubernetes",
+    "error handling", "observability", "authentication", "data migration",
+    "code review", "system architecture", "caching", "message queues",
+    "RAG systems", "embedding models", "vector databases", "document chunking",
+    "hybrid search",
+]
+_ASPECTS = [
+    "best practices", "common pitfalls", "configuration", "troubleshooting",
+    "design patterns", "performance tuning", "getting started", "advanced usage",
+]
+
+
+def _synthetic_documents(count: int) -> list[tuple[str, str]]:
+    """Return (id, content) pairs covering every topic/aspect combination."""
+    documents = []
+    for i in range(count):
+        topic = _TOPICS[i % len(_TOPICS)]
+        aspect = _ASPECTS[(i // len(_TOPICS)) % len(_ASPECTS)]
+        content = (
+            f"# {topic.title()}: {aspect} (note {i})\n\n"
+            f"This note covers {aspect} for {topic}. It describes how teams apply "
+            f"{topic} in production, which {aspect} matter most, and how to verify "
+            f"the result."
+        )
+        documents.append((f"perf_doc_{i:05d}", content))
+    return documents
+
+
+@pytest.fixture(scope="session")
+def populated_store(embedder):
+    """
+    ChromaDB collection holding PERF_CORPUS_SIZE synthetic documents.
+
+    Documents are embedded in one batched call and written with a single
+    add_documents() call (the adapter splits it into HTTP batches).
+    The collection is cleared at the end of the session.
+    """
+    from memoria.adapters.chromadb.chromadb_adapter import ChromaDBAdapter
+
+    store = ChromaDBAdapter(
+        collection_name="memoria_perf_queries",
+        use_http=True,
+        http_host="localhost",
+        http_port=8001,
+        timeout=60.0,
+    )
+    store.clear()
+
+    pairs = _synthetic_documents(PERF_CORPUS_SIZE)
+    embeddings = embedder.embed_batch([content for _, content in pairs])
+    store.add_documents([
+        Document(
+            id=doc_id,
+            content=content,
+            metadata={"source": "perf_corpus"},
+            embedding=embedding.to_list(),
+        )
+        for (doc_id, content), embedding in zip(pairs, embeddings)
+    ])
+
+    yield store
+    store.clear()
+
+
+@pytest.fixture(scope="session")
+def perf_search_engine(populated_store, embedder):
+    """Search engine over the synthetic performance corpus."""
+    from memoria.adapters.search.search_engine_adapter import SearchEngineAdapter
+
+    return SearchEngineAdapter(populated_store, embedder, hybrid_weight=0.95)
@@ -14,13 +14,13 @@ Requires: ChromaDB running on localhost:8001.
 import time
 import tempfile
 import shutil
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 
 import pytest
 
 from memoria.adapters.chromadb.chromadb_adapter import ChromaDBAdapter
-from memoria.adapters.sentence_transformers.sentence_transformer_adapter import SentenceTransformerAdapter
-from memoria.adapters.document.document_processor_adapter import DocumentProcessorAdapter
 from memoria.domain.entities import Document, ProgressTracker
 
 
@@ -38,16 +38,6 @@ def test_vector_store():
     vs.clear()
 
 
-@pytest.fixture(scope="module")
-def embedder():
-    return SentenceTransformerAdapter(model_name="all-MiniLM-L6-v2")
-
-
-@pytest.fixture(scope="module")
-def doc_processor():
-    return DocumentProcessorAdapter(chunk_size=2000, chunk_overlap=100)
-
-
 @pytest.fixture
 def temp_docs_dir():
     """Create temporary directory with test documents."""
@@ -56,14 +46,20 @@ def temp_docs_dir():
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+TEST_PARAGRAPH = "This is test content for performance benchmarking. " * 20 + "\n\n"
+
+
+@lru_cache(maxsize=None)
+def _filler(size: int) -> str:
+    """Return enough repeated paragraphs to fill a document of `size` characters."""
+    return TEST_PARAGRAPH * (size // len(TEST_PARAGRAPH) + 1)
+
+
 def generate_test_doc(path: Path, size_kb: int = 10) -> Path:
     """Generate a test markdown document of specified size."""
-    content = f"# Test Document: {path.stem}\n\n"
-    paragraph = "This is test content for performance benchmarking. " * 20 + "\n\n"
-    while len(content) < size_kb * 1024:
-        content += paragraph
-    content = content[:size_kb * 1024]
-    path.write_text(content, encoding="utf-8")
+    size = size_kb * 1024
+    content = f"# Test Document: {path.stem}\n\n" + _filler(size)
+    path.write_bytes(content[:size].encode("utf-8"))
     return path
 
 
@@ -75,22 +71,36 @@ class TestBatchEmbedding:
         texts = [f"This is test document number {i} about topic {i % 5}" for i in range(50)]
 
         # Sequential
-        start = time.time()
+        start = time.perf_counter()
         for text in texts:
             embedder.embed_text(text)
-        seq_time = time.time() - start
+        seq_time = time.perf_counter() - start
 
         # Batch
-        start = time.time()
+        start = time.perf_counter()
         embedder.embed_batch(texts)
-        batch_time = time.time() - start
+        batch_time = time.perf_counter() - start
+
+        # Reference: one direct encode() call on the underlying model. encode()
+        # already length-sorts inputs into batches, so this is the floor the
+        # adapter's embed_batch() should approach.
+        model = embedder.model
+        start = time.perf_counter()
+        model.encode(texts, batch_size=32, convert_to_numpy=True, show_progress_bar=False)
+        reference_time = time.perf_counter() - start
+
+        # Report tokens/sec so padding or tokenization regressions show up
+        # even when the text count stays the same
+        token_count = sum(len(ids) for ids in model.tokenizer(texts)["input_ids"])
 
         speedup = seq_time / batch_time if batch_time > 0 else float("inf")
 
         print(f"\nBatch vs Sequential Embedding:")
-        print(f"  Sequential: {seq_time * 1000:.1f}ms ({len(texts)} texts)")
-        print(f"  Batch:      {batch_time * 1000:.1f}ms ({len(texts)} texts)")
-        print(f"  Speedup:    {speedup:.1f}x")
+        print(f"  Sequential: {seq_time * 1000:.1f}ms ({token_count / seq_time:.0f} tokens/s)")
+        print(f"  Batch:      {batch_time * 1000:.1f}ms ({token_count / batch_time:.0f} tokens/s)")
+        print(f"  Reference:  {reference_time * 1000:.1f}ms "
+              f"({token_count / reference_time:.0f} tokens/s, raw model.encode)")
+        print(f"  Speedup:    {speedup:.1f}x ({len(texts)} texts, {token_count} tokens)")
 
         assert batch_time <= seq_time, (
             f"Batch ({batch_time:.3f}s) should be <= sequential ({seq_time:.3f}s)"
@@ -143,45 +153,25 @@ class TestProgressiveBatching:
             path = generate_test_doc(temp_docs_dir / f"doc_{i:03d}.md", size_kb=5)
             docs.append(path)
 
-        # Process and commit in small batches (batch_size=5 for test speed)
+        # Chunk every document, then embed all chunks in one batched call
+        chunks = [c for doc_path in docs for c in doc_processor.process_document(doc_path)]
+        embeddings = embedder.embed_batch(list(map(attrgetter("content"), chunks)))
+        docs_with_emb = [
+            Document(
+                id=c.id, content=c.content,
+                embedding=e.to_list(), metadata=c.metadata,
+            )
+            for c, e in zip(chunks, embeddings)
+        ]
+
+        # Commit in small batches (batch_size=5 for test speed)
         BATCH_SIZE = 5
-        pending = []
-        total_committed = 0
         commit_counts = []
-
-        for doc_path in docs:
-            chunks = doc_processor.process_document(doc_path)
-            pending.extend(chunks)
-
-            if len(pending) >= BATCH_SIZE:
-                texts = [c.content for c in pending]
-                embeddings = embedder.embed_batch(texts)
-                docs_with_emb = [
-                    Document(
-                        id=c.id, content=c.content,
-                        embedding=e.to_list(), metadata=c.metadata,
-                    )
-                    for c, e in zip(pending, embeddings)
-                ]
-                test_vector_store.add_documents(docs_with_emb)
-                total_committed += len(docs_with_emb)
-                commit_counts.append(len(docs_with_emb))
-                pending = []
-
-        # Commit remaining
-        if pending:
-            texts = [c.content for c in pending]
-            embeddings = embedder.embed_batch(texts)
-            docs_with_emb = [
-                Document(
-                    id=c.id, content=c.content,
-                    embedding=e.to_list(), metadata=c.metadata,
-                )
-                for c, e in zip(pending, embeddings)
-            ]
-            test_vector_store.add_documents(docs_with_emb)
-            total_committed += len(docs_with_emb)
-            commit_counts.append(len(docs_with_emb))
+        for i in range(0, len(docs_with_emb), BATCH_SIZE):
+            batch = docs_with_emb[i:i + BATCH_SIZE]
+            test_vector_store.add_documents(batch)
+            commit_counts.append(len(batch))
+        total_committed = sum(commit_counts)
 
         print(f"\nProgressive Batching:")
         print(f"  Total committed: {total_committed} chunks")
@@ -6,33 +6,22 @@ Validates:
 - Concurrent query handling (10 simultaneous users, <3s each)
 - No search quality regression after optimization
 
+Latency tests run against a synthetic 2000-document collection (see
+conftest.py); quality regression tests run against the production
+collection, whose content their thresholds are calibrated to.
+
 Requires: ChromaDB running on localhost:8001 with populated collection.
 """
 
+import asyncio
 import time
 import pytest
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from memoria.adapters.chromadb.chromadb_adapter import ChromaDBAdapter
-from memoria.adapters.sentence_transformers.sentence_transformer_adapter import SentenceTransformerAdapter
-from memoria.adapters.search.search_engine_adapter import SearchEngineAdapter
+import numpy as np
 
 
-@pytest.fixture(scope="module")
-def search_engine():
-    """Create search engine connected to production ChromaDB."""
-    vector_store = ChromaDBAdapter(
-        collection_name="memoria",
-        use_http=True,
-        http_host="localhost",
-        http_port=8001,
-    )
-    embedder = SentenceTransformerAdapter(model_name="all-MiniLM-L6-v2")
-    engine = SearchEngineAdapter(vector_store, embedder, hybrid_weight=0.95)
-    return engine
-
-
-DIVERSE_QUERIES = [
+DIVERSE_QUERIES = (
     "python programming best practices",
     "machine learning model training",
     "docker container management",
@@ -83,38 +72,66 @@ DIVERSE_QUERIES = [
     "circuit breaker pattern",
     "retry with backoff",
     "distributed tracing",
-]
+)
+
+HIGH_RELEVANCE_QUERIES = (
+    "RAG search ChromaDB",
+    "embedding model sentence transformer",
+    "document indexing chunking",
+)
+
 
+@pytest.fixture(scope="module")
+def query_embeddings(embedder):
+    """Embed the diverse test queries once, in a single batch."""
+    return dict(zip(DIVERSE_QUERIES, embedder.embed_batch(list(DIVERSE_QUERIES))))
+
+
+@pytest.fixture(scope="module")
+def _warmup(perf_search_engine):
+    """Prime model weights, the HTTP connection and the HNSW index before timing.
 
+    Two distinct queries, so the second still runs a forward pass rather
+    than hitting the engine's query embedding cache.
+    """
+    perf_search_engine.search(query="warmup", limit=1, mode="hybrid")
+    perf_search_engine.search(query="warmup query", limit=1, mode="hybrid")
+
+
+@pytest.mark.usefixtures("_warmup")
 class TestQueryPerformance:
     """SC-004: 90% of queries complete in <2 seconds."""
 
-    def test_query_latency_under_2_seconds(self, search_engine):
+    def test_query_latency_under_2_seconds(self, perf_search_engine):
         """90% of 50 diverse queries must complete in <2s."""
-        latencies = []
 
-        for query in DIVERSE_QUERIES:
-            start = time.time()
-            results = search_engine.search(query=query, limit=5, mode="hybrid")
-            elapsed = time.time() - start
-            latencies.append(elapsed)
-
-        # Sort latencies to find P90
-        latencies.sort()
-        p90_index = int(len(latencies) * 0.9) - 1
-        p90_latency = latencies[p90_index]
-        p99_latency = latencies[-1]
-        mean_latency = sum(latencies) / len(latencies)
+        def run_query(query):
+            start = time.perf_counter()
+            perf_search_engine.search(query=query, limit=5, mode="hybrid")
+            return time.perf_counter() - start
+
+        # Each query times itself, so overlapping them keeps per-query latency
+        # while the ChromaDB round trips run in parallel
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            latencies = np.fromiter(
+                executor.map(run_query, DIVERSE_QUERIES), dtype=float, count=len(DIVERSE_QUERIES)
+            )
+
+        p50_latency, p90_latency, p95_latency, p99_latency = np.percentile(
+            latencies, [50, 90, 95, 99]
+        )
 
         print(f"\nQuery Performance Results:")
         print(f"  Total queries: {len(latencies)}")
-        print(f"  Mean latency:  {mean_latency * 1000:.1f}ms")
+        print(f"  Mean latency:  {latencies.mean() * 1000:.1f}ms")
+        print(f"  P50 latency:   {p50_latency * 1000:.1f}ms")
         print(f"  P90 latency:   {p90_latency * 1000:.1f}ms")
+        print(f"  P95 latency:   {p95_latency * 1000:.1f}ms")
         print(f"  P99 latency:   {p99_latency * 1000:.1f}ms")
-        print(f"  Min latency:   {min(latencies) * 1000:.1f}ms")
-        print(f"  Max latency:   {max(latencies) * 1000:.1f}ms")
+        print(f"  Min latency:   {latencies.min() * 1000:.1f}ms")
+        print(f"  Max latency:   {latencies.max() * 1000:.1f}ms")
 
-        under_2s = sum(1 for l in latencies if l < 2.0)
+        under_2s = int((latencies < 2.0).sum())
         pct_under_2s = under_2s / len(latencies) * 100
 
         print(f"  Under 2s:      {under_2s}/{len(latencies)} ({pct_under_2s:.1f}%)")
@@ -125,17 +142,18 @@ class TestQueryPerformance:
         )
 
 
+@pytest.mark.usefixtures("_warmup")
 class TestConcurrentQueries:
     """Test concurrent query performance (10 simultaneous users)."""
 
-    def test_concurrent_queries_under_3_seconds(self, search_engine):
+    def test_concurrent_queries_under_3_seconds(self, perf_search_engine):
         """10 concurrent queries must each complete in <3s."""
         queries = DIVERSE_QUERIES[:10]
 
         def run_query(query):
-            start = time.time()
-            results = search_engine.search(query=query, limit=5, mode="hybrid")
-            elapsed = time.time() - start
+            start = time.perf_counter()
+            results = perf_search_engine.search(query=query, limit=5, mode="hybrid")
+            elapsed = time.perf_counter() - start
             return query, elapsed, len(results)
 
         results_list = []
@@ -159,19 +177,60 @@ class TestConcurrentQueries:
             f"Concurrent query test FAIL: max latency {max_latency * 1000:.1f}ms (need <3000ms)"
         )
 
+    @pytest.mark.asyncio
+    async def test_concurrent_async_queries_under_3_seconds(
+        self, populated_store, query_embeddings
+    ):
+        """10 concurrent vector queries on one event loop must each complete in <3s.
+
+        Complements the threaded test above: queries are embedded up front
+        and only the ChromaDB round trips run concurrently, all in flight on
+        a single async HTTP client.
+        """
+        import chromadb
+
+        if not hasattr(chromadb, "AsyncHttpClient"):
+            pytest.skip("chromadb.AsyncHttpClient requires chromadb>=0.5")
+
+        client = await chromadb.AsyncHttpClient(host="localhost", port=8001)
+        collection = await client.get_collection(populated_store.collection_name)
+
+        async def run_query(query):
+            start = time.perf_counter()
+            response = await collection.query(
+                query_embeddings=[query_embeddings[query].to_list()],
+                n_results=5,
+            )
+            return query, time.perf_counter() - start, len(response["ids"][0])
+
+        results_list = await asyncio.gather(*(run_query(q) for q in DIVERSE_QUERIES[:10]))
+
+        print(f"\nConcurrent Async Query Results (10 in flight):")
+        for query, elapsed, count in results_list:
+            status = "OK" if elapsed < 3.0 else "SLOW"
+            print(f"  [{status}] {elapsed * 1000:.1f}ms - {count} results - {query[:40]}...")
+
+        max_latency = max(e for _, e, _ in results_list)
+        print(f"  Max concurrent latency: {max_latency * 1000:.1f}ms")
+
+        assert max_latency < 3.0, (
+            f"Concurrent async query test FAIL: max latency {max_latency * 1000:.1f}ms "
+            f"(need <3000ms)"
+        )
+
 
 class TestSearchQualityRegression:
     """Verify no quality regression after performance optimization."""
 
     def test_results_return_5_plus(self, search_engine):
         """SC-001: 90% of queries return 5+ results."""
-        queries_with_5_plus = 0
         total = 10
 
-        for query in DIVERSE_QUERIES[:total]:
-            results = search_engine.search(query=query, limit=10, mode="hybrid")
-            if len(results) >= 5:
-                queries_with_5_plus += 1
+        # One batched embedding pass for all queries, through the public port
+        all_results = search_engine.search_batch(
+            list(DIVERSE_QUERIES[:total]), mode="hybrid", limit=10
+        )
+        queries_with_5_plus = sum(1 for results in all_results if len(results) >= 5)
 
         pct = queries_with_5_plus / total * 100
         print(f"\nQuality Regression Check:")
@@ -181,15 +240,12 @@ class TestSearchQualityRegression:
 
     def test_high_relevance_scores(self, search_engine):
         """SC-003: High-relevance queries score ≥0.7."""
-        high_rel_queries = [
-            "RAG search ChromaDB",
-            "embedding model sentence transformer",
-            "document indexing chunking",
-        ]
         all_pass = True
 
-        for query in high_rel_queries:
-            results = search_engine.search(query=query, limit=5, mode="hybrid")
+        all_results = search_engine.search_batch(
+            list(HIGH_RELEVANCE_QUERIES), mode="hybrid", limit=5
+        )
+        for query, results in zip(HIGH_RELEVANCE_QUERIES, all_results):
             if results:
                 top_score = results[0].score
                 passed = top_score >= 0.7
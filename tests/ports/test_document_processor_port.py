@@ -12,6 +12,12 @@ import pytest
 from memoria.domain.entities import Chunk, Document
 from memoria.domain.ports.document_processor import DocumentProcessorPort
 
+# Sample texts, built once and shared by every adapter's run of the suite
+SENTENCE_TEXT = "This is a test. " * 100  # 1600 chars
+LONG_WORD_TEXT = "word " * 500  # 2500 chars
+SHORT_WORD_TEXT = "word " * 200  # 1000 chars
+DOCUMENT_CONTENT = "This is test content. " * 50  # 1100 chars
+
 
 class DocumentProcessorPortTests(ABC):
     """
@@ -34,7 +40,9 @@ class DocumentProcessorPortTests(ABC):
         """
         ...
 
-    def create_test_file(self, tmp_path: Path, content: str, extension: str) -> Path:
+    def create_test_file(
+        self, tmp_path: Path, content: str | bytes, extension: str
+    ) -> Path:
         """
         Optional hook for subclasses to create test files.
 
@@ -43,14 +51,14 @@ class DocumentProcessorPortTests(ABC):
 
         Args:
             tmp_path: pytest tmp_path fixture
-            content: Text content for the file
+            content: Text content for the file (str is written as UTF-8)
             extension: File extension (e.g., "txt", "pdf")
 
         Returns:
             Path to created test file
         """
         file_path = tmp_path / f"test.{extension}"
-        file_path.write_text(content)
+        file_path.write_bytes(content.encode("utf-8") if isinstance(content, str) else content)
         return file_path
 
     @pytest.fixture
@@ -60,7 +68,7 @@ class DocumentProcessorPortTests(ABC):
 
     def test_chunk_text_returns_chunks(self, processor: DocumentProcessorPort) -> None:
         """Test that chunk_text returns a list of Chunks."""
-        text = "This is a test. " * 100  # 1600+ chars
+        text = SENTENCE_TEXT
         chunks = processor.chunk_text(text, chunk_size=500, overlap=50)
         assert isinstance(chunks, list)
         assert len(chunks) > 0
@@ -68,7 +76,7 @@ class DocumentProcessorPortTests(ABC):
 
     def test_chunk_text_respects_chunk_size(self, processor: DocumentProcessorPort) -> None:
         """Test that chunks are approximately the requested size."""
-        text = "word " * 500  # 2500 chars
+        text = LONG_WORD_TEXT
         chunk_size = 500
         chunks = processor.chunk_text(text, chunk_size=chunk_size, overlap=0)
 
@@ -79,7 +87,7 @@ class DocumentProcessorPortTests(ABC):
 
     def test_chunk_text_no_overlap(self, processor: DocumentProcessorPort) -> None:
         """Test that chunks don't overlap when overlap=0."""
-        text = "word " * 200
+        text = SHORT_WORD_TEXT
         chunks = processor.chunk_text(text, chunk_size=200, overlap=0)
 
         for i in range(len(chunks) - 1):
@@ -88,7 +96,7 @@ class DocumentProcessorPortTests(ABC):
 
     def test_chunk_text_with_overlap(self, processor: DocumentProcessorPort) -> None:
         """Test that chunks overlap when overlap > 0."""
-        text = "word " * 200
+        text = SHORT_WORD_TEXT
         overlap = 50
         chunks = processor.chunk_text(text, chunk_size=200, overlap=overlap)
 
@@ -139,7 +147,7 @@ class DocumentProcessorPortTests(ABC):
         self, processor: DocumentProcessorPort, tmp_path: Path
     ) -> None:
         """Test that process_document returns a list of Documents."""
-        content = "This is test content. " * 50  # ~1000+ chars
+        content = DOCUMENT_CONTENT
         file_path = self.create_test_file(tmp_path, content, "txt")
 
         docs = processor.process_document(file_path, chunk_size=500)
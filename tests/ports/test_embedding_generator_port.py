@@ -59,7 +59,8 @@ class EmbeddingGeneratorPortTests(ABC):
         """Test that different texts produce different embeddings."""
         emb1 = generator.embed_text("python programming")
         emb2 = generator.embed_text("cooking recipes")
-        assert emb1.vector != emb2.vector
+        # Differences within float noise do not count as different embeddings
+        assert any(abs(a - b) > 1e-6 for a, b in zip(emb1.vector, emb2.vector))
 
     def test_embed_batch_returns_list(self, generator: EmbeddingGeneratorPort) -> None:
         """Test that embed_batch returns a list of embeddings."""
@@ -72,12 +73,12 @@ class EmbeddingGeneratorPortTests(ABC):
         """Test that embed_batch preserves input order."""
         texts = ["alpha", "beta", "gamma"]
         embeddings = generator.embed_batch(texts)
+        reversed_embeddings = generator.embed_batch(texts[::-1])[::-1]
 
-        # Each batch embedding should match individual embedding
-        for text, batch_emb in zip(texts, embeddings):
-            individual_emb = generator.embed_text(text)
-            # Embeddings should be identical (or very close due to floating point)
-            assert batch_emb.dimensions == individual_emb.dimensions
+        # Reordering the input must reorder the output the same way
+        # (allowing for floating point differences between batches)
+        for batch_emb, reordered_emb in zip(embeddings, reversed_embeddings):
+            assert batch_emb.vector == pytest.approx(reordered_emb.vector, abs=1e-5)
 
     def test_embed_batch_consistent_dimensions(
         self, generator: EmbeddingGeneratorPort
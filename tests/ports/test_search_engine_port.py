@@ -5,12 +5,17 @@ All SearchEngine adapters must pass these tests.
 """
 
 from abc import ABC, abstractmethod
+from itertools import pairwise
 
 import pytest
 
 from memoria.domain.entities import Document, SearchResult
 from memoria.domain.ports.search_engine import SearchEnginePort
-from memoria.domain.value_objects import QueryTerms
+from memoria.domain.value_objects import QueryTerms, SearchMode
+
+SEARCH_QUERIES = ("test query", "test", "python programming")
+SEARCH_MODES: tuple[SearchMode, ...] = ("semantic", "bm25", "hybrid")
+BATCH_LIMIT = 3
 
 
 class SearchEnginePortTests(ABC):
@@ -43,45 +48,62 @@ class SearchEnginePortTests(ABC):
         """
         pass
 
-    @pytest.fixture
-    def engine(self) -> SearchEnginePort:
-        """Fixture that provides a search engine for each test."""
-        engine = self.create_engine()
-        self.index_test_documents(engine)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def engine(cls) -> SearchEnginePort:
+        """
+        Search engine shared by every test in the class.
+
+        The port tests only read from the engine, so create_engine() and
+        index_test_documents() run once per adapter subclass.
+        """
+        suite = cls()
+        engine = suite.create_engine()
+        suite.index_test_documents(engine)
         return engine
 
-    def test_search_returns_results(self, engine: SearchEnginePort) -> None:
-        """Test that search returns a list of SearchResults."""
-        results = engine.search(query="test query", mode="semantic", limit=5)
+    @pytest.fixture(scope="class")
+    @classmethod
+    def batch_results(
+        cls, engine: SearchEnginePort
+    ) -> dict[tuple[str, SearchMode], list[SearchResult]]:
+        """Run every (query, mode) case with one search_batch() call per mode."""
+        return {
+            (query, mode): results
+            for mode in SEARCH_MODES
+            for query, results in zip(
+                SEARCH_QUERIES,
+                engine.search_batch(list(SEARCH_QUERIES), mode=mode, limit=BATCH_LIMIT),
+            )
+        }
+
+    @pytest.mark.parametrize("mode", SEARCH_MODES)
+    @pytest.mark.parametrize("query", SEARCH_QUERIES)
+    def test_search_batch_returns_results(
+        self,
+        batch_results: dict[tuple[str, SearchMode], list[SearchResult]],
+        query: str,
+        mode: SearchMode,
+    ) -> None:
+        """Test that each batched query returns at most limit SearchResults."""
+        results = batch_results[(query, mode)]
         assert isinstance(results, list)
+        assert len(results) <= BATCH_LIMIT
         assert all(isinstance(r, SearchResult) for r in results)
 
-    def test_search_respects_limit(self, engine: SearchEnginePort) -> None:
-        """Test that search returns at most limit results."""
-        results = engine.search(query="test", mode="hybrid", limit=3)
-        assert len(results) <= 3
-
-    def test_search_semantic_mode(self, engine: SearchEnginePort) -> None:
-        """Test search with semantic mode."""
-        results = engine.search(query="python programming", mode="semantic", limit=5)
-        assert isinstance(results, list)
-
-    def test_search_bm25_mode(self, engine: SearchEnginePort) -> None:
-        """Test search with BM25 mode."""
-        results = engine.search(query="python programming", mode="bm25", limit=5)
-        assert isinstance(results, list)
-
-    def test_search_hybrid_mode(self, engine: SearchEnginePort) -> None:
-        """Test search with hybrid mode."""
-        results = engine.search(query="python programming", mode="hybrid", limit=5)
-        assert isinstance(results, list)
+    def test_search_batch_matches_search(self, engine: SearchEnginePort) -> None:
+        """Test that search_batch returns the same results as per-query search."""
+        batched = engine.search_batch(list(SEARCH_QUERIES), mode="hybrid", limit=BATCH_LIMIT)
+        assert len(batched) == len(SEARCH_QUERIES)
+        for query, results in zip(SEARCH_QUERIES, batched):
+            single = engine.search(query=query, mode="hybrid", limit=BATCH_LIMIT)
+            assert [r.document.id for r in results] == [r.document.id for r in single]
 
     def test_search_results_ordered_by_score(self, engine: SearchEnginePort) -> None:
         """Test that search results are ordered by relevance score."""
         results = engine.search(query="test", mode="hybrid", limit=10)
-        if len(results) > 1:
-            for i in range(len(results) - 1):
-                assert results[i].score >= results[i + 1].score
+        scores = [r.score for r in results]
+        assert all(a >= b for a, b in pairwise(scores)), scores
 
     def test_expand_query_returns_query_terms(self, engine: SearchEnginePort) -> None:
         """Test that expand_query returns QueryTerms."""
@@ -96,32 +118,31 @@ class SearchEnginePortTests(ABC):
         terms = engine.expand_query(query)
         assert query in terms.all_terms
 
-    def test_rerank_returns_results(self, engine: SearchEnginePort) -> None:
-        """Test that rerank returns a list of SearchResults."""
-        # Create some mock results
-        doc = Document(id="doc1", content="test", metadata={}, embedding=[0.1] * 4)
-        initial_results = [
-            SearchResult(document=doc, score=0.5, rank=0),
-            SearchResult(document=doc, score=0.3, rank=1),
-        ]
-
-        reranked = engine.rerank(query="test", results=initial_results)
-        assert isinstance(reranked, list)
-        assert len(reranked) == len(initial_results)
-        assert all(isinstance(r, SearchResult) for r in reranked)
-
-    def test_rerank_preserves_all_results(self, engine: SearchEnginePort) -> None:
-        """Test that rerank returns all input results (possibly reordered)."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def rerank_inputs(cls) -> tuple[SearchResult, ...]:
+        """Initial results for the rerank tests, built once per class."""
         doc1 = Document(id="doc1", content="first", metadata={}, embedding=[0.1] * 4)
         doc2 = Document(id="doc2", content="second", metadata={}, embedding=[0.2] * 4)
-
-        initial_results = [
+        return (
             SearchResult(document=doc1, score=0.3, rank=0),
             SearchResult(document=doc2, score=0.7, rank=1),
-        ]
+        )
 
-        reranked = engine.rerank(query="test", results=initial_results)
-        assert len(reranked) == 2
+    def test_rerank_returns_results(
+        self, engine: SearchEnginePort, rerank_inputs: tuple[SearchResult, ...]
+    ) -> None:
+        """Test that rerank returns a list of SearchResults."""
+        reranked = engine.rerank(query="test", results=list(rerank_inputs))
+        assert isinstance(reranked, list)
+        assert len(reranked) == len(rerank_inputs)
+        assert all(isinstance(r, SearchResult) for r in reranked)
+
+    def test_rerank_preserves_all_results(
+        self, engine: SearchEnginePort, rerank_inputs: tuple[SearchResult, ...]
+    ) -> None:
+        """Test that rerank returns all input results (possibly reordered)."""
+        reranked = engine.rerank(query="test", results=list(rerank_inputs))
         # All original documents should be present
         reranked_ids = {r.document.id for r in reranked}
         assert reranked_ids == {"doc1", "doc2"}
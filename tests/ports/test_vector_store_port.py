@@ -6,12 +6,47 @@ by inheriting from this class and implementing create_store().
 """
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from itertools import pairwise
 
 import pytest
 
 from memoria.domain.entities import Document, SearchResult
 from memoria.domain.ports.vector_store import VectorStorePort
 
+# Documents are frozen, so one set is built at import and shared by every
+# adapter's run of the suite; store.clear() between tests keeps them isolated.
+SAMPLE_DOC = Document(
+    id="doc1",
+    content="Python is a programming language",
+    metadata={"source": "test.txt", "lang": "en"},
+    embedding=[0.1, 0.2, 0.3, 0.4],
+)
+INDEXED_DOCS = tuple(
+    Document(
+        id=f"doc{i}",
+        content=f"Content {i}",
+        metadata={"index": str(i)},
+        embedding=[0.1 * i, 0.2 * i, 0.3 * i, 0.4 * i],
+    )
+    for i in range(5)
+)
+UNIFORM_DOCS = tuple(
+    Document(
+        id=f"doc{i}",
+        content=f"Content {i}",
+        metadata={},
+        embedding=[0.1 * i] * 4,
+    )
+    for i in range(10)
+)
+
+QUERY_EMBEDDINGS = (
+    [0.1, 0.2, 0.3, 0.4],
+    [0.5, 0.5, 0.5, 0.5],
+    [0.4, 0.1, 0.3, 0.2],
+)
+
 
 class VectorStorePortTests(ABC):
     """
@@ -38,102 +73,97 @@ class VectorStorePortTests(ABC):
         """
         ...
 
-    @pytest.fixture
-    def store(self) -> VectorStorePort:
-        """Fixture that provides a fresh store for each test."""
-        store = self.create_store()
-        store.clear()  # Ensure clean state
-        return store
+    @pytest.fixture(scope="class")
+    @classmethod
+    def shared_store(cls) -> VectorStorePort:
+        """
+        Adapter instance shared by every test in the class.
+
+        Construction can be expensive (opening database files, creating
+        indices), so create_store() runs once per test class.
+        """
+        return cls().create_store()
 
     @pytest.fixture
-    def sample_doc(self) -> Document:
-        """Fixture providing a sample document with embedding."""
-        return Document(
-            id="doc1",
-            content="Python is a programming language",
-            metadata={"source": "test.txt", "lang": "en"},
-            embedding=[0.1, 0.2, 0.3, 0.4],
-        )
-
-    def test_add_documents_single(self, store: VectorStorePort, sample_doc: Document) -> None:
+    def store(self, shared_store: VectorStorePort) -> VectorStorePort:
+        """Fixture that provides an empty store for each test."""
+        shared_store.clear()  # Ensure clean state
+        return shared_store
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def indexed_store(cls) -> Iterator[VectorStorePort]:
+        """
+        Separate adapter instance holding UNIFORM_DOCS, indexed once per class.
+
+        Read-only tests share it so the corpus is inserted once rather than
+        per test. Tests that add, delete or clear use the store fixture.
+        """
+        store = cls().create_store()
+        store.clear()
+        store.add_documents(list(UNIFORM_DOCS))
+        yield store
+        store.clear()
+
+    def test_add_documents_single(self, store: VectorStorePort) -> None:
         """Test adding a single document."""
-        store.add_documents([sample_doc])
+        store.add_documents([SAMPLE_DOC])
         stats = store.get_stats()
         assert stats["document_count"] >= 1
 
     def test_add_documents_batch(self, store: VectorStorePort) -> None:
         """Test adding multiple documents at once."""
-        docs = [
-            Document(
-                id=f"doc{i}",
-                content=f"Content {i}",
-                metadata={"index": str(i)},
-                embedding=[0.1 * i, 0.2 * i, 0.3 * i, 0.4 * i],
-            )
-            for i in range(5)
-        ]
-        store.add_documents(docs)
+        store.add_documents(list(INDEXED_DOCS))
         stats = store.get_stats()
         assert stats["document_count"] >= 5
 
-    def test_search_returns_results(self, store: VectorStorePort, sample_doc: Document) -> None:
+    def test_search_returns_results(self, indexed_store: VectorStorePort) -> None:
         """Test that search returns relevant results."""
-        store.add_documents([sample_doc])
-        results = store.search(query_embedding=[0.1, 0.2, 0.3, 0.4], k=1)
+        results = indexed_store.search(query_embedding=[0.1, 0.2, 0.3, 0.4], k=1)
         assert len(results) >= 1
         assert isinstance(results[0], SearchResult)
         assert 0.0 <= results[0].score <= 1.0
 
-    def test_search_respects_k_limit(self, store: VectorStorePort) -> None:
+    def test_search_respects_k_limit(self, indexed_store: VectorStorePort) -> None:
         """Test that search returns at most k results."""
-        docs = [
-            Document(
-                id=f"doc{i}",
-                content=f"Content {i}",
-                metadata={},
-                embedding=[0.1 * i] * 4,
-            )
-            for i in range(10)
-        ]
-        store.add_documents(docs)
-
-        results = store.search(query_embedding=[0.5, 0.5, 0.5, 0.5], k=3)
+        results = indexed_store.search(query_embedding=[0.5, 0.5, 0.5, 0.5], k=3)
         assert len(results) <= 3
 
-    def test_search_orders_by_relevance(self, store: VectorStorePort) -> None:
+    def test_search_orders_by_relevance(self, indexed_store: VectorStorePort) -> None:
         """Test that search results are ordered by relevance (score)."""
-        docs = [
-            Document(
-                id=f"doc{i}",
-                content=f"Content {i}",
-                metadata={},
-                embedding=[0.1 * i] * 4,
-            )
-            for i in range(5)
-        ]
-        store.add_documents(docs)
-
-        results = store.search(query_embedding=[0.3, 0.3, 0.3, 0.3], k=5)
+        results = indexed_store.search(query_embedding=[0.3, 0.3, 0.3, 0.3], k=5)
         # Results should be ordered by score (highest first)
-        for i in range(len(results) - 1):
-            assert results[i].score >= results[i + 1].score
-
-    def test_get_by_id_existing(self, store: VectorStorePort, sample_doc: Document) -> None:
+        scores = [r.score for r in results]
+        assert all(a >= b for a, b in pairwise(scores)), scores
+
+    def test_search_batch_equivalent_to_search(self, indexed_store: VectorStorePort) -> None:
+        """Test that one search_batch call matches a search per query."""
+        batched = indexed_store.search_batch(list(QUERY_EMBEDDINGS), k=3)
+        assert len(batched) == len(QUERY_EMBEDDINGS)
+        for query_embedding, results in zip(QUERY_EMBEDDINGS, batched):
+            single = indexed_store.search(query_embedding=query_embedding, k=3)
+            assert [r.score for r in results] == pytest.approx([r.score for r in single])
+
+    def test_search_batch_no_queries(self, indexed_store: VectorStorePort) -> None:
+        """Test that search_batch with no queries returns no results."""
+        assert indexed_store.search_batch([], k=3) == []
+
+    def test_get_by_id_existing(self, indexed_store: VectorStorePort) -> None:
         """Test retrieving an existing document by ID."""
-        store.add_documents([sample_doc])
-        retrieved = store.get_by_id("doc1")
+        expected = UNIFORM_DOCS[1]
+        retrieved = indexed_store.get_by_id(expected.id)
         assert retrieved is not None
-        assert retrieved.id == "doc1"
-        assert retrieved.content == sample_doc.content
+        assert retrieved.id == expected.id
+        assert retrieved.content == expected.content
 
     def test_get_by_id_nonexistent(self, store: VectorStorePort) -> None:
         """Test retrieving a non-existent document returns None."""
         result = store.get_by_id("nonexistent")
         assert result is None
 
-    def test_delete_existing(self, store: VectorStorePort, sample_doc: Document) -> None:
+    def test_delete_existing(self, store: VectorStorePort) -> None:
         """Test deleting an existing document."""
-        store.add_documents([sample_doc])
+        store.add_documents([SAMPLE_DOC])
         result = store.delete("doc1")
         assert result is True
         # Verify it's actually deleted
@@ -145,17 +175,16 @@ class VectorStorePortTests(ABC):
         result = store.delete("nonexistent")
         assert result is False
 
-    def test_get_stats(self, store: VectorStorePort, sample_doc: Document) -> None:
+    def test_get_stats(self, indexed_store: VectorStorePort) -> None:
         """Test getting store statistics."""
-        store.add_documents([sample_doc])
-        stats = store.get_stats()
+        stats = indexed_store.get_stats()
         assert isinstance(stats, dict)
         assert "document_count" in stats
-        assert stats["document_count"] >= 1
+        assert stats["document_count"] == len(UNIFORM_DOCS)
 
-    def test_clear(self, store: VectorStorePort, sample_doc: Document) -> None:
+    def test_clear(self, store: VectorStorePort) -> None:
         """Test clearing all documents from the store."""
-        store.add_documents([sample_doc])
+        store.add_documents([SAMPLE_DOC])
         store.clear()
         stats = store.get_stats()
         assert stats["document_count"] == 0
@@ -1,7 +1,9 @@
 """Tests for skill_helpers.py - the public API layer.
 
-These tests use real adapters (not stubs) to verify end-to-end integration.
-They test the actual functions that Claude Code will call.
+They test the actual functions that Claude Code will call. By default each
+test runs against stub vector store and embedding adapters behind the real
+search engine and document processor, so only output shape is exercised.
+Tests marked real_adapters run end-to-end against ChromaDB and the model.
 """
 
 import io
@@ -14,6 +16,80 @@ import pytest
 from memoria import skill_helpers
 
 
+@pytest.fixture(scope="module")
+def stub_adapters():
+    """Adapters with a stub vector store and embedder, built once per module."""
+    from memoria.adapters.document.document_processor_adapter import DocumentProcessorAdapter
+    from memoria.adapters.search.search_engine_adapter import SearchEngineAdapter
+    from memoria.adapters.stubs.embedding_generator_stub import EmbeddingGeneratorStub
+    from memoria.adapters.stubs.vector_store_stub import VectorStoreStub
+
+    vector_store = VectorStoreStub()
+    embedder = EmbeddingGeneratorStub(dimensions=384)
+    search_engine = SearchEngineAdapter(vector_store, embedder, hybrid_weight=0.95)
+    document_processor = DocumentProcessorAdapter(chunk_size=2000, chunk_overlap=100)
+    return (vector_store, embedder, search_engine, document_processor)
+
+
+@pytest.fixture(scope="module")
+def warm_adapters():
+    """Create the real adapters and load the embedding model once per module.
+
+    Later calls to _get_adapters() reuse them, so no test pays the model load.
+    """
+    adapters = skill_helpers._get_adapters()
+    adapters[1].model  # Force the lazy SentenceTransformer load
+    return adapters
+
+
+@pytest.fixture(autouse=True)
+def _install_adapters(request):
+    """Install stub adapters for each test unless it is marked real_adapters."""
+    if request.node.get_closest_marker("real_adapters"):
+        adapters = request.getfixturevalue("warm_adapters")
+    else:
+        adapters = request.getfixturevalue("stub_adapters")
+    previous = skill_helpers._adapters
+    skill_helpers._set_adapters(adapters)
+    yield
+    skill_helpers._set_adapters(previous)
+
+
+@pytest.fixture
+def docs_dir(tmp_path, monkeypatch):
+    """Point skill_helpers.DOCS_DIR at an empty docs/ directory under tmp_path."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    monkeypatch.setattr(skill_helpers, 'DOCS_DIR', docs)
+    return docs
+
+
+@pytest.fixture
+def mock_adapters(request):
+    """Install a mock vector store whose collection.get() returns request.param."""
+    mock_store = Mock()
+    mock_store.get_collection.return_value.get.return_value = request.param
+    # The autouse _install_adapters fixture restores the previous adapters
+    skill_helpers._set_adapters((mock_store, None, None, None))
+    return mock_store
+
+
+@pytest.fixture
+def broken_adapters(request):
+    """Install a mock vector store whose collection count raises request.param."""
+    mock_store = Mock()
+    mock_store._collection.count.side_effect = Exception(request.param)
+    skill_helpers._set_adapters((mock_store, None, None, None))
+    return mock_store
+
+
+@pytest.fixture
+def unindexed(request):
+    """Patch check_unindexed_documents to report request.param as unindexed."""
+    with patch.object(skill_helpers, 'check_unindexed_documents', return_value=request.param):
+        yield request.param
+
+
 class TestSearchKnowledge:
     """Tests for search_knowledge function."""
 
@@ -56,39 +132,35 @@ class TestSearchKnowledge:
 class TestIndexDocuments:
     """Tests for index_documents function."""
 
-    def test_index_with_no_documents(self, tmp_path):
+    def test_index_with_no_documents(self, docs_dir):
         """Test indexing when docs directory is empty."""
-        # Temporarily override DOCS_DIR
-        with patch.object(skill_helpers, 'DOCS_DIR', tmp_path):
-            result = skill_helpers.index_documents()
+        result = skill_helpers.index_documents()
 
-            assert isinstance(result, str)
-            # Should indicate no documents found
-            assert "No documents" in result or "0 documents" in result
+        assert isinstance(result, str)
+        # Should indicate no documents found
+        assert "No documents" in result or "0 documents" in result
 
-    def test_index_with_markdown_pattern(self, tmp_path):
+    def test_index_with_markdown_pattern(self, docs_dir):
         """Test indexing with markdown file pattern."""
         # Create a test markdown file
-        test_doc = tmp_path / "test.md"
+        test_doc = docs_dir / "test.md"
         test_doc.write_text("# Test Document\n\nTest content")
 
-        with patch.object(skill_helpers, 'DOCS_DIR', tmp_path):
-            result = skill_helpers.index_documents(pattern="**/*.md")
+        result = skill_helpers.index_documents(pattern="**/*.md")
 
-            assert isinstance(result, str)
-            # Should have processed the file
-            assert "test.md" in result or "1" in result
+        assert isinstance(result, str)
+        # Should have processed the file
+        assert "test.md" in result or "1" in result
 
-    def test_index_handles_errors_gracefully(self, tmp_path):
+    def test_index_handles_errors_gracefully(self, docs_dir):
         """Test that indexing handles errors without crashing."""
         # Create a file that might cause issues
-        bad_file = tmp_path / "bad.md"
+        bad_file = docs_dir / "bad.md"
         bad_file.write_text("")  # Empty file
 
-        with patch.object(skill_helpers, 'DOCS_DIR', tmp_path):
-            # Should not raise, but return error message
-            result = skill_helpers.index_documents()
-            assert isinstance(result, str)
+        # Should not raise, but return error message
+        result = skill_helpers.index_documents()
+        assert isinstance(result, str)
 
 
 class TestAddDocument:
@@ -101,70 +173,61 @@ class TestAddDocument:
         assert isinstance(result, str)
         assert "Not found" in result or "❌" in result
 
-    def test_add_existing_document(self, tmp_path):
+    def test_add_existing_document(self, tmp_path, docs_dir):
         """Test adding an existing document."""
         source_file = tmp_path / "source.md"
         source_file.write_text("Test content")
 
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
-
-        with patch.object(skill_helpers, 'DOCS_DIR', docs_dir):
-            result = skill_helpers.add_document(str(source_file), reindex=False)
+        result = skill_helpers.add_document(str(source_file), reindex=False)
 
-            assert isinstance(result, str)
-            # Should indicate success or duplicate
-            assert "Added" in result or "exists" in result
+        assert isinstance(result, str)
+        # Should indicate success or duplicate
+        assert "Added" in result or "exists" in result
 
-    def test_add_with_reindex_flag(self, tmp_path):
+    def test_add_with_reindex_flag(self, tmp_path, docs_dir):
         """Test adding document with reindex enabled."""
         source_file = tmp_path / "source.md"
         source_file.write_text("Test content")
 
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
+        # Mock index_documents to avoid actual reindexing
+        with patch.object(skill_helpers, 'index_documents', return_value="Mocked"):
+            result = skill_helpers.add_document(str(source_file), reindex=True)
 
-        with patch.object(skill_helpers, 'DOCS_DIR', docs_dir):
-            # Mock index_documents to avoid actual reindexing
-            with patch.object(skill_helpers, 'index_documents', return_value="Mocked"):
-                result = skill_helpers.add_document(str(source_file), reindex=True)
-
-                assert isinstance(result, str)
+            assert isinstance(result, str)
 
 
 class TestListIndexedDocuments:
     """Tests for list_indexed_documents function."""
 
-    def test_list_with_no_documents(self, tmp_path):
+    def test_list_with_no_documents(self, docs_dir):
         """Test listing when no documents exist."""
-        with patch.object(skill_helpers, 'DOCS_DIR', tmp_path):
-            result = skill_helpers.list_indexed_documents()
+        result = skill_helpers.list_indexed_documents()
 
-            assert isinstance(result, str)
-            assert "No documents" in result or "0 files" in result
+        assert isinstance(result, str)
+        assert "No documents" in result or "0 files" in result
 
-    def test_list_with_documents(self, tmp_path):
+    def test_list_with_documents(self, docs_dir):
         """Test listing when documents exist."""
         # Create test files
-        (tmp_path / "doc1.md").write_text("Content 1")
-        (tmp_path / "doc2.md").write_text("Content 2")
+        (docs_dir / "doc1.md").write_text("Content 1")
+        (docs_dir / "doc2.md").write_text("Content 2")
 
-        subdir = tmp_path / "subdir"
+        subdir = docs_dir / "subdir"
         subdir.mkdir()
         (subdir / "doc3.md").write_text("Content 3")
 
-        with patch.object(skill_helpers, 'DOCS_DIR', tmp_path):
-            result = skill_helpers.list_indexed_documents()
+        result = skill_helpers.list_indexed_documents()
 
-            assert isinstance(result, str)
-            assert "doc1.md" in result
-            assert "doc2.md" in result
-            assert "doc3.md" in result
+        assert isinstance(result, str)
+        assert "doc1.md" in result
+        assert "doc2.md" in result
+        assert "doc3.md" in result
 
 
 class TestGetStats:
     """Tests for get_stats function."""
 
+    @pytest.mark.real_adapters
     def test_get_stats_returns_formatted_output(self):
         """Test that get_stats returns formatted statistics."""
         result = skill_helpers.get_stats()
@@ -172,23 +235,20 @@ class TestGetStats:
         assert isinstance(result, str)
         assert "Stats" in result or "Chunks" in result
 
-    def test_get_stats_handles_errors_gracefully(self):
+    @pytest.mark.parametrize("broken_adapters", ["Connection error"], indirect=True)
+    def test_get_stats_handles_errors_gracefully(self, broken_adapters):
         """Test that get_stats handles ChromaDB errors."""
-        # Mock the collection to raise an error
-        with patch.object(skill_helpers, '_get_adapters') as mock_adapters:
-            mock_store = Mock()
-            mock_store._collection.count.side_effect = Exception("Connection error")
-            mock_adapters.return_value = (mock_store, None, None, None)
+        result = skill_helpers.get_stats()
 
-            result = skill_helpers.get_stats()
-            assert isinstance(result, str)
-            # Should contain error indicator
-            assert "❌" in result or "error" in result.lower()
+        assert isinstance(result, str)
+        # Should contain error indicator
+        assert "❌" in result or "error" in result.lower()
 
 
 class TestHealthCheck:
     """Tests for health_check function."""
 
+    @pytest.mark.real_adapters
     def test_health_check_returns_status(self):
         """Test that health_check returns health status."""
         result = skill_helpers.health_check()
@@ -196,76 +256,71 @@ class TestHealthCheck:
         assert isinstance(result, str)
         assert "Health" in result or "healthy" in result.lower()
 
-    def test_health_check_reports_errors(self):
+    @pytest.mark.parametrize("broken_adapters", ["ChromaDB down"], indirect=True)
+    def test_health_check_reports_errors(self, broken_adapters):
         """Test that health_check reports errors when services are down."""
-        with patch.object(skill_helpers, '_get_adapters') as mock_adapters:
-            mock_store = Mock()
-            mock_store._collection.count.side_effect = Exception("ChromaDB down")
-            mock_adapters.return_value = (mock_store, None, None, None)
+        result = skill_helpers.health_check()
 
-            result = skill_helpers.health_check()
-            assert isinstance(result, str)
-            assert "Failed" in result or "❌" in result
+        assert isinstance(result, str)
+        assert "Failed" in result or "❌" in result
 
 
 class TestCheckUnindexedDocuments:
     """Tests for check_unindexed_documents function."""
 
-    def test_check_with_no_documents(self, tmp_path):
+    @pytest.mark.parametrize("mock_adapters", [{'metadatas': []}], indirect=True)
+    def test_check_with_no_documents(self, docs_dir, mock_adapters):
         """Test checking when no documents exist."""
-        with patch.object(skill_helpers, 'DOCS_DIR', tmp_path):
-            result = skill_helpers.check_unindexed_documents()
-
-            assert isinstance(result, list)
-            assert len(result) == 0
-
-    def test_check_with_unindexed_documents(self, tmp_path):
-        """Test checking when unindexed documents exist."""
+        result = skill_helpers.check_unindexed_documents()
+
+        assert isinstance(result, list)
+        assert len(result) == 0
+
+    @pytest.mark.parametrize(
+        ("mock_adapters", "expected"),
+        [
+            ({'metadatas': []}, ["docs/unindexed.md"]),
+            ({'metadatas': [{'source': "docs/unindexed.md"}]}, []),
+        ],
+        indirect=["mock_adapters"],
+    )
+    def test_check_with_unindexed_documents(
+        self, tmp_path, docs_dir, monkeypatch, mock_adapters, expected
+    ):
+        """Test that only documents missing from the collection are reported."""
         # Create test file
-        (tmp_path / "unindexed.md").write_text("Content")
-
-        with patch.object(skill_helpers, 'DOCS_DIR', tmp_path):
-            with patch.object(skill_helpers, 'MEMORIA_ROOT', tmp_path):
-                # Mock vector store to return empty indexed set
-                with patch.object(skill_helpers, '_get_adapters') as mock_adapters:
-                    mock_store = Mock()
-                    mock_collection = Mock()
-                    mock_collection.get.return_value = {'metadatas': []}
-                    mock_store.get_collection.return_value = mock_collection
-                    mock_adapters.return_value = (mock_store, None, None, None)
+        (docs_dir / "unindexed.md").write_text("Content")
+        monkeypatch.setattr(skill_helpers, 'MEMORIA_ROOT', tmp_path)
 
-                    result = skill_helpers.check_unindexed_documents()
+        result = skill_helpers.check_unindexed_documents()
 
-                    assert isinstance(result, list)
-                    assert len(result) > 0
+        assert result == expected
 
 
 class TestAutoIndexNewDocuments:
     """Tests for auto_index_new_documents function."""
 
-    def test_auto_index_with_no_new_documents(self, tmp_path):
-        """Test auto-indexing when all documents are indexed."""
-        with patch.object(skill_helpers, 'check_unindexed_documents', return_value=[]):
+    @pytest.mark.parametrize(
+        ("unindexed", "expected"),
+        [
+            ([], "already indexed"),
+            (["docs/new1.md", "docs/new2.md"], "found 2 unindexed"),
+        ],
+        indirect=["unindexed"],
+    )
+    def test_auto_index_reports_unindexed(self, unindexed, expected):
+        """Test auto-indexing output with and without new documents."""
+        with patch.object(skill_helpers, 'index_documents', return_value="Indexed"):
             result = skill_helpers.auto_index_new_documents()
 
-            assert isinstance(result, str)
-            assert "already indexed" in result.lower()
-
-    def test_auto_index_with_new_documents(self, tmp_path):
-        """Test auto-indexing when new documents exist."""
-        fake_unindexed = ["docs/new1.md", "docs/new2.md"]
-
-        with patch.object(skill_helpers, 'check_unindexed_documents', return_value=fake_unindexed):
-            with patch.object(skill_helpers, 'index_documents', return_value="Indexed"):
-                result = skill_helpers.auto_index_new_documents()
-
-                assert isinstance(result, str)
-                assert "2" in result or "new" in result.lower()
+        assert isinstance(result, str)
+        assert expected in result.lower()
 
 
 class TestGetAdapters:
     """Tests for _get_adapters private function."""
 
+    @pytest.mark.real_adapters
     def test_adapters_are_singletons(self):
         """Test that adapters are created only once (singleton pattern)."""
         adapters1 = skill_helpers._get_adapters()
@@ -277,6 +332,16 @@ class TestGetAdapters:
         assert adapters1[2] is adapters2[2]  # search_engine
         assert adapters1[3] is adapters2[3]  # document_processor
 
+    def test_set_adapters_replaces_and_resets(self):
+        """Test that _set_adapters installs adapters and None resets them."""
+        fake = (Mock(), Mock(), Mock(), Mock())
+        skill_helpers._set_adapters(fake)
+        assert skill_helpers._get_adapters() is fake
+
+        skill_helpers._set_adapters(None)
+        assert skill_helpers._adapters is None
+
+    @pytest.mark.real_adapters
     def test_adapters_initialization(self):
         """Test that all adapters are properly initialized."""
         vector_store, embedder, search_engine, doc_processor = skill_helpers._get_adapters()
@@ -287,34 +352,31 @@ class TestGetAdapters:
         assert doc_processor is not None
 
 
+@pytest.mark.skipif(skill_helpers.RICH_AVAILABLE, reason="Rich is installed; fallbacks unused")
 class TestRichFallback:
     """Tests for Rich library fallback behavior."""
 
     def test_console_fallback_when_rich_unavailable(self):
         """Test that Console works even if Rich is not available."""
-        # Create a fallback console
-        if not skill_helpers.RICH_AVAILABLE:
-            console = skill_helpers.Console(file=io.StringIO())
-            console.print("Test message")
+        console = skill_helpers.Console(file=io.StringIO())
+        console.print("Test message")
 
-            output = console.file.getvalue()
-            assert "Test message" in output
+        output = console.file.getvalue()
+        assert "Test message" in output
 
     def test_panel_fallback_when_rich_unavailable(self):
         """Test that Panel works even if Rich is not available."""
-        if not skill_helpers.RICH_AVAILABLE:
-            panel = skill_helpers.Panel("Test content")
-            output = str(panel)
+        panel = skill_helpers.Panel("Test content")
+        output = str(panel)
 
-            assert "Test content" in output
+        assert "Test content" in output
 
     def test_table_fallback_when_rich_unavailable(self):
         """Test that Table works even if Rich is not available."""
-        if not skill_helpers.RICH_AVAILABLE:
-            table = skill_helpers.Table()
-            table.add_column("Col1")
-            table.add_row("Value1")
-
-            # Should not crash
-            assert table.columns == ["Col1"]
-            assert len(table.rows) == 1
+        table = skill_helpers.Table()
+        table.add_column("Col1")
+        table.add_row("Value1")
+
+        # Should not crash
+        assert table.columns == ["Col1"]
+        assert len(table.rows) == 1
@@ -2,292 +2,174 @@
 
 import json
 import os
-import sys
+import subprocess
 import tempfile
+import uuid
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 
 import pytest
 
-
 # We test the version check functions directly, not the full skill_helpers
-# since that requires ChromaDB. Import the module and mock adapters.
+# API: adapter imports are deferred, so importing the module needs no ChromaDB.
+# If it still cannot be imported, skip the whole module once at collection.
+skill_helpers = pytest.importorskip("memoria.skill_helpers")
+_check_version_cache = skill_helpers._check_version_cache
+_mark_notification_shown = skill_helpers._mark_notification_shown
+_should_notify_update = skill_helpers._should_notify_update
+_update_version_cache = skill_helpers._update_version_cache
+
+# Computed once at import; a fresh cache stays within the 24h TTL for the run
+_NOW = datetime.now(timezone.utc)
+_NOW_ISO = _NOW.isoformat()
+_STALE_ISO = (_NOW - timedelta(hours=25)).isoformat()
+
+
+def _raise(exc):
+    """Return a subprocess.run stand-in that raises exc."""
+    def run(*args, **kwargs):
+        raise exc
+    return run
+
+
+@pytest.fixture(scope="session")
+def cache_dir(tmp_path_factory):
+    """One directory for every test's cache file, created once per session."""
+    return tmp_path_factory.mktemp("version-cache")
+
+
+@pytest.fixture(autouse=True)
+def cache_path(cache_dir, monkeypatch):
+    """Point skill_helpers at a cache file name unique to each test."""
+    path = cache_dir / f"{uuid.uuid4().hex}.version-cache"
+    monkeypatch.setattr(skill_helpers, "_VERSION_CACHE_PATH", path)
+    return path
+
+
+@pytest.fixture
+def version_cache(cache_path, request):
+    """
+    Write a version cache and return (path, data).
+
+    request.param selects the cache state: a dict overrides fields of a
+    fresh cache, a str is written verbatim, and None leaves no file.
+    """
+    param = getattr(request, "param", {})
+    if param is None:
+        return cache_path, None
+    if isinstance(param, str):
+        cache_path.write_text(param)
+        return cache_path, None
+
+    data = {
+        "latest_version": "2.0.0",
+        "current_version": "1.0.0",
+        "checked_at": _NOW_ISO,
+        "cache_ttl_hours": 24,
+        "update_available": True,
+        "notification_shown": False,
+        "check_error": None,
+    }
+    data.update(param)
+    with cache_path.open("w") as f:
+        json.dump(data, f)
+    return cache_path, data
 
 
 class TestCheckVersionCache:
     """Test _check_version_cache with various cache states."""
 
-    def test_missing_cache_returns_none(self, tmp_path):
-        """Cache file doesn't exist → returns None."""
-        from memoria.skill_helpers import _check_version_cache, _VERSION_CACHE_PATH
-
-        with patch.object(
-            sys.modules["memoria.skill_helpers"],
-            "_VERSION_CACHE_PATH",
-            tmp_path / ".version-cache",
-        ):
-            result = _check_version_cache()
+    @pytest.mark.parametrize(
+        ("version_cache", "expected_latest"),
+        [
+            pytest.param(None, None, id="missing"),
+            pytest.param({"latest_version": "1.2.0"}, "1.2.0", id="fresh"),
+            pytest.param({"checked_at": _STALE_ISO}, None, id="stale"),
+            pytest.param("not valid json {{{", None, id="corrupt"),
+        ],
+        indirect=["version_cache"],
+    )
+    def test_check_version_cache(self, version_cache, expected_latest):
+        """Only a fresh, valid cache is returned; anything else → None."""
+        result = _check_version_cache()
+        if expected_latest is None:
             assert result is None
-
-    def test_fresh_cache_returns_data(self, tmp_path):
-        """Cache file is fresh (within TTL) → returns data."""
-        from memoria.skill_helpers import _check_version_cache
-
-        cache_file = tmp_path / ".version-cache"
-        cache_data = {
-            "latest_version": "1.2.0",
-            "current_version": "1.0.0",
-            "checked_at": datetime.now(timezone.utc).isoformat(),
-            "cache_ttl_hours": 24,
-            "update_available": True,
-            "notification_shown": False,
-            "check_error": None,
-        }
-        cache_file.write_text(json.dumps(cache_data))
-
-        with patch.object(
-            sys.modules["memoria.skill_helpers"],
-            "_VERSION_CACHE_PATH",
-            cache_file,
-        ):
-            result = _check_version_cache()
+        else:
             assert result is not None
-            assert result["latest_version"] == "1.2.0"
+            assert result["latest_version"] == expected_latest
             assert result["update_available"] is True
 
-    def test_stale_cache_returns_none(self, tmp_path):
-        """Cache file is stale (beyond TTL) → returns None."""
-        from memoria.skill_helpers import _check_version_cache
-
-        cache_file = tmp_path / ".version-cache"
-        stale_time = (datetime.now(timezone.utc) - timedelta(hours=25)).isoformat()
-        cache_data = {
-            "latest_version": "1.2.0",
-            "current_version": "1.0.0",
-            "checked_at": stale_time,
-            "cache_ttl_hours": 24,
-            "update_available": True,
-            "notification_shown": False,
-            "check_error": None,
-        }
-        cache_file.write_text(json.dumps(cache_data))
-
-        with patch.object(
-            sys.modules["memoria.skill_helpers"],
-            "_VERSION_CACHE_PATH",
-            cache_file,
-        ):
-            result = _check_version_cache()
-            assert result is None
-
-    def test_corrupt_cache_returns_none(self, tmp_path):
-        """Cache file has invalid JSON → returns None gracefully."""
-        from memoria.skill_helpers import _check_version_cache
-
-        cache_file = tmp_path / ".version-cache"
-        cache_file.write_text("not valid json {{{")
-
-        with patch.object(
-            sys.modules["memoria.skill_helpers"],
-            "_VERSION_CACHE_PATH",
-            cache_file,
-        ):
-            result = _check_version_cache()
-            assert result is None
-
 
 class TestShouldNotifyUpdate:
     """Test _should_notify_update with various version combinations."""
 
-    def test_no_cache_no_notify(self, tmp_path):
-        """No cache → no notification."""
-        from memoria.skill_helpers import _should_notify_update
-
-        with patch.object(
-            sys.modules["memoria.skill_helpers"],
-            "_VERSION_CACHE_PATH",
-            tmp_path / ".version-cache",
-        ):
-            should, version = _should_notify_update()
-            assert should is False
-
-    def test_update_available_notify(self, tmp_path):
-        """Update available + not yet shown → notify."""
-        from memoria.skill_helpers import _should_notify_update
-
-        cache_file = tmp_path / ".version-cache"
-        cache_data = {
-            "latest_version": "2.0.0",
-            "current_version": "1.0.0",
-            "checked_at": datetime.now(timezone.utc).isoformat(),
-            "cache_ttl_hours": 24,
-            "update_available": True,
-            "notification_shown": False,
-            "check_error": None,
-        }
-        cache_file.write_text(json.dumps(cache_data))
-
-        with patch.object(
-            sys.modules["memoria.skill_helpers"],
-            "_VERSION_CACHE_PATH",
-            cache_file,
-        ):
-            should, version = _should_notify_update()
-            assert should is True
-            assert version == "2.0.0"
-
-    def test_notification_already_shown(self, tmp_path):
-        """Update available but already shown → no notification."""
-        from memoria.skill_helpers import _should_notify_update
-
-        cache_file = tmp_path / ".version-cache"
-        cache_data = {
-            "latest_version": "2.0.0",
-            "current_version": "1.0.0",
-            "checked_at": datetime.now(timezone.utc).isoformat(),
-            "cache_ttl_hours": 24,
-            "update_available": True,
-            "notification_shown": True,
-            "check_error": None,
-        }
-        cache_file.write_text(json.dumps(cache_data))
-
-        with patch.object(
-            sys.modules["memoria.skill_helpers"],
-            "_VERSION_CACHE_PATH",
-            cache_file,
-        ):
-            should, version = _should_notify_update()
-            assert should is False
-
-    def test_no_update_available(self, tmp_path):
-        """Same version → no notification."""
-        from memoria.skill_helpers import _should_notify_update
-
-        cache_file = tmp_path / ".version-cache"
-        cache_data = {
-            "latest_version": "1.0.0",
-            "current_version": "1.0.0",
-            "checked_at": datetime.now(timezone.utc).isoformat(),
-            "cache_ttl_hours": 24,
-            "update_available": False,
-            "notification_shown": False,
-            "check_error": None,
-        }
-        cache_file.write_text(json.dumps(cache_data))
-
-        with patch.object(
-            sys.modules["memoria.skill_helpers"],
-            "_VERSION_CACHE_PATH",
-            cache_file,
-        ):
-            should, version = _should_notify_update()
-            assert should is False
+    @pytest.mark.parametrize(
+        ("version_cache", "expected"),
+        [
+            pytest.param(None, (False, ""), id="no-cache"),
+            pytest.param({}, (True, "2.0.0"), id="update-available"),
+            pytest.param({"notification_shown": True}, (False, ""), id="already-shown"),
+            pytest.param(
+                {"latest_version": "1.0.0", "update_available": False},
+                (False, ""),
+                id="no-update",
+            ),
+        ],
+        indirect=["version_cache"],
+    )
+    def test_should_notify_update(self, version_cache, expected):
+        """Notify only when an update is available and not yet shown."""
+        assert _should_notify_update() == expected
 
 
 class TestMarkNotificationShown:
     """Test _mark_notification_shown flag persistence."""
 
-    def test_marks_shown_in_cache(self, tmp_path):
+    def test_marks_shown_in_cache(self, version_cache):
         """After marking, notification_shown should be True in file."""
-        from memoria.skill_helpers import _mark_notification_shown
-
-        cache_file = tmp_path / ".version-cache"
-        cache_data = {
-            "latest_version": "2.0.0",
-            "current_version": "1.0.0",
-            "checked_at": datetime.now(timezone.utc).isoformat(),
-            "cache_ttl_hours": 24,
-            "update_available": True,
-            "notification_shown": False,
-            "check_error": None,
-        }
-        cache_file.write_text(json.dumps(cache_data))
-
-        with patch.object(
-            sys.modules["memoria.skill_helpers"],
-            "_VERSION_CACHE_PATH",
-            cache_file,
-        ):
-            _mark_notification_shown()
+        cache_file, _ = version_cache
+
+        _mark_notification_shown()
 
         updated = json.loads(cache_file.read_text())
         assert updated["notification_shown"] is True
 
-    def test_missing_cache_no_error(self, tmp_path):
+    def test_missing_cache_no_error(self):
         """Missing cache file → no error raised."""
-        from memoria.skill_helpers import _mark_notification_shown
-
-        with patch.object(
-            sys.modules["memoria.skill_helpers"],
-            "_VERSION_CACHE_PATH",
-            tmp_path / ".nonexistent-cache",
-        ):
-            _mark_notification_shown()  # Should not raise
+        _mark_notification_shown()  # Should not raise
 
 
 class TestUpdateVersionCache:
-    """Test _update_version_cache with mocked subprocess."""
+    """Test _update_version_cache with a stubbed subprocess.run."""
 
-    def test_gh_not_available(self, tmp_path):
+    def test_gh_not_available(self, cache_path, monkeypatch):
         """gh CLI not installed → graceful failure, no error."""
-        from memoria.skill_helpers import _update_version_cache
-        import subprocess
+        monkeypatch.setattr(subprocess, "run", _raise(FileNotFoundError("gh not found")))
 
-        with patch("subprocess.run", side_effect=FileNotFoundError("gh not found")):
-            with patch.object(
-                sys.modules["memoria.skill_helpers"],
-                "_VERSION_CACHE_PATH",
-                tmp_path / ".version-cache",
-            ):
-                _update_version_cache()  # Should not raise
+        _update_version_cache()  # Should not raise
 
-        assert not (tmp_path / ".version-cache").exists()
+        assert not cache_path.exists()
 
-    def test_network_timeout(self, tmp_path):
+    def test_network_timeout(self, monkeypatch):
         """Network timeout → graceful failure."""
-        from memoria.skill_helpers import _update_version_cache
-        import subprocess
-
-        with patch(
-            "subprocess.run",
-            side_effect=subprocess.TimeoutExpired("gh", 5),
-        ):
-            with patch.object(
-                sys.modules["memoria.skill_helpers"],
-                "_VERSION_CACHE_PATH",
-                tmp_path / ".version-cache",
-            ):
-                _update_version_cache()  # Should not raise
-
-    def test_successful_check_writes_cache(self, tmp_path):
+        monkeypatch.setattr(subprocess, "run", _raise(subprocess.TimeoutExpired("gh", 5)))
+
+        _update_version_cache()  # Should not raise
+
+    def test_successful_check_writes_cache(self, tmp_path, cache_path, monkeypatch):
         """Successful gh call → writes cache file."""
-        from memoria.skill_helpers import _update_version_cache
-
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "v2.0.0\n"
-
-        cache_file = tmp_path / ".version-cache"
-
-        with patch("subprocess.run", return_value=mock_result):
-            with patch.object(
-                sys.modules["memoria.skill_helpers"],
-                "_VERSION_CACHE_PATH",
-                cache_file,
-            ):
-                with patch.object(
-                    sys.modules["memoria.skill_helpers"],
-                    "MEMORIA_ROOT",
-                    tmp_path,
-                ):
-                    # Create a VERSION file
-                    (tmp_path / "VERSION").write_text("1.0.0")
-                    _update_version_cache()
-
-        assert cache_file.exists()
-        data = json.loads(cache_file.read_text())
+        result = SimpleNamespace(returncode=0, stdout="v2.0.0\n")
+        monkeypatch.setattr(subprocess, "run", lambda *args, **kwargs: result)
+
+        monkeypatch.setattr(skill_helpers, "MEMORIA_ROOT", tmp_path)
+        # Create a VERSION file
+        (tmp_path / "VERSION").write_text("1.0.0")
+
+        _update_version_cache()
+
+        assert cache_path.exists()
+        data = json.loads(cache_path.read_text())
         assert data["latest_version"] == "2.0.0"
         assert data["current_version"] == "1.0.0"
         assert data["update_available"] is True